@@ -0,0 +1,286 @@
+"""
+Evaluation Engine - concurrent task execution behind evaluate().
+
+Runs the tasks of one or many config vectors concurrently on a shared
+pool, so evaluating a config over a 50-task corpus costs roughly
+50 / max_concurrency API round trips instead of 50.
+
+Provides:
+- TokenBucket: async token-bucket rate limiter (requests per second)
+- EvaluationEngine: bounded concurrency, rate limiting, per-request
+  timeouts and retries, with sync wrappers for non-async callers
+
+The blocking runtime.execute() runs on the engine's thread pool; an
+asyncio semaphore bounds how many are in flight and the token bucket
+spaces out their starts. Outcomes are aggregated in task order, so
+results match sequential evaluation exactly.
+
+Used by:
+- core.runtime.evaluate() (the GlobalMOO thin waist contract)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .config import FullConfig, VectorCodec
+from .runtime import ExecutionMetrics, ExecutionResult, aggregate_outcomes, create_runtime
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() waits until a token is available. Waiters are served in
+    arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available, then take them."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+
+class EvaluationEngine:
+    """
+    Concurrent evaluator for the evaluate(config_vector, tasks) contract.
+
+    One engine can be shared by many config vectors; its concurrency limit
+    and rate limit apply across all of them.
+
+    Usage:
+        engine = EvaluationEngine(max_concurrency=8, requests_per_second=4)
+        outcomes = engine.evaluate(vector, tasks)
+        many = engine.evaluate_many([v1, v2, v3], tasks)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        timeout_s: Optional[float] = 120.0,
+        max_retries: int = 2,
+        backoff_s: float = 0.5,
+        runtime_factory: Optional[Callable[[FullConfig], Any]] = None,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            max_concurrency: Maximum requests in flight
+            requests_per_second: Token-bucket rate (None = unlimited)
+            burst: Token-bucket capacity (defaults to the rate)
+            timeout_s: Per-attempt timeout (None = no timeout)
+            max_retries: Retries after a failed or timed-out attempt
+            backoff_s: Base delay for exponential backoff between retries
+            runtime_factory: Function(FullConfig) -> runtime with
+                execute(task, task_type) (default: mock runtime, as in evaluate())
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.timeout_s = timeout_s
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.runtime_factory = runtime_factory or (lambda config: create_runtime(config, use_mock=True))
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="evaluate"
+        )
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {"requests": 0, "retries": 0, "timeouts": 0, "failures": 0}
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def evaluate_async(
+        self,
+        config_vector: List[float],
+        tasks: List[Dict[str, Any]],
+    ) -> Dict[str, float]:
+        """Evaluate one config vector with its tasks run concurrently."""
+        return (await self.evaluate_many_async([config_vector], tasks))[0]
+
+    async def evaluate_many_async(
+        self,
+        config_vectors: Sequence[List[float]],
+        tasks: List[Dict[str, Any]],
+    ) -> List[Dict[str, float]]:
+        """Evaluate many config vectors through one shared pool."""
+        limits = self._limits()
+        runtimes = [self.runtime_factory(VectorCodec.decode(v)) for v in config_vectors]
+
+        per_config = [
+            asyncio.gather(*(
+                self._execute(runtime, task_data, limits) for task_data in tasks
+            ))
+            for runtime in runtimes
+        ]
+        results = await asyncio.gather(*per_config)
+
+        return [
+            aggregate_outcomes(runtime, task_results)
+            for runtime, task_results in zip(runtimes, results)
+        ]
+
+    def _limits(self):
+        """Semaphore and bucket bound to the running event loop."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        bucket = None
+        if self.requests_per_second:
+            bucket = TokenBucket(self.requests_per_second, self.burst)
+        return semaphore, bucket
+
+    async def _execute(self, runtime: Any, task_data: Dict[str, Any], limits) -> ExecutionResult:
+        """Run one task with rate limiting, timeout, and retries."""
+        semaphore, bucket = limits
+        task = task_data.get("task", "")
+        task_type = task_data.get("task_type", "default")
+        loop = asyncio.get_running_loop()
+
+        result: Optional[ExecutionResult] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count("retries")
+                await asyncio.sleep(self.backoff_s * (2 ** (attempt - 1)))
+
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                self._count("requests")
+                call = loop.run_in_executor(self._executor, runtime.execute, task, task_type)
+                try:
+                    result = await asyncio.wait_for(call, self.timeout_s)
+                except asyncio.TimeoutError:
+                    # The worker thread cannot be interrupted; it finishes in
+                    # the background and its result is discarded
+                    self._count("timeouts")
+                    result = ExecutionResult(
+                        response="",
+                        success=False,
+                        error=f"Timed out after {self.timeout_s}s",
+                        metrics=ExecutionMetrics(),
+                    )
+                except Exception as e:
+                    result = ExecutionResult(
+                        response="",
+                        success=False,
+                        error=f"Unexpected error: {e}",
+                        metrics=ExecutionMetrics(),
+                    )
+
+            if result.success or not getattr(runtime, "is_available", True):
+                return result
+            logger.debug(f"Task attempt {attempt + 1} failed: {result.error}")
+
+        self._count("failures")
+        return result
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def evaluate(
+        self,
+        config_vector: List[float],
+        tasks: List[Dict[str, Any]],
+    ) -> Dict[str, float]:
+        """Synchronous evaluate_async()."""
+        return self._run(self.evaluate_async(config_vector, tasks))
+
+    def evaluate_many(
+        self,
+        config_vectors: Sequence[List[float]],
+        tasks: List[Dict[str, Any]],
+    ) -> List[Dict[str, float]]:
+        """Synchronous evaluate_many_async()."""
+        return self._run(self.evaluate_many_async(config_vectors, tasks))
+
+    @staticmethod
+    def _run(coro):
+        """Run a coroutine to completion, even if called from inside an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Already inside a loop (e.g. a notebook): run on a helper thread
+        box: Dict[str, Any] = {}
+
+        def runner():
+            try:
+                box["result"] = asyncio.run(coro)
+            except BaseException as e:
+                box["error"] = e
+
+        thread = threading.Thread(target=runner)
+        thread.start()
+        thread.join()
+        if "error" in box:
+            raise box["error"]
+        return box["result"]
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+
+_default_engine: Optional[EvaluationEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_evaluation_engine() -> EvaluationEngine:
+    """Get the shared engine used by core.runtime.evaluate()."""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = EvaluationEngine()
+    return _default_engine
+
+
+def set_evaluation_engine(engine: Optional[EvaluationEngine]) -> None:
+    """Replace the shared engine (None restores the default on next use)."""
+    global _default_engine
+    with _default_engine_lock:
+        _default_engine = engine
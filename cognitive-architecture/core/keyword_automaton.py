@@ -0,0 +1,137 @@
+"""
+Multi-pattern Keyword Automaton (Aho-Corasick)
+
+Compiles a set of literal keywords into a single automaton that reports
+every occurrence of every keyword, including overlapping ones, in one
+left-to-right pass over the text. Matching cost is O(len(text) + matches)
+regardless of how many keywords are compiled in.
+
+Used for:
+- FrameRegistry keyword triggers (core/verilingua.py)
+
+Matching is plain substring matching, the same semantics as
+`keyword in text`. Callers that want case-insensitive matching should
+lowercase the text (patterns are lowercased at compile time).
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton compiled to a full transition table.
+
+    Each state's transition dict already includes the transitions inherited
+    through its failure links, so matching does a single dict lookup per
+    character with no failure-link walking.
+
+    Usage:
+        automaton = KeywordAutomaton(["he", "she", "hers"])
+        for start, index in automaton.iter_matches("ushers"):
+            print(start, automaton.patterns[index])
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile patterns into the automaton.
+
+        Args:
+            patterns: Keywords to match. Empty strings are ignored;
+                duplicates keep the index of their first occurrence.
+        """
+        self.patterns: List[str] = []
+        self._index: Dict[str, int] = {}
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if pattern and pattern not in self._index:
+                self._index[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+
+        self._delta: List[Dict[str, int]] = []
+        self._outputs: List[Tuple[int, ...]] = []
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def index_of(self, pattern: str) -> int:
+        """Return the pattern index for a keyword (KeyError if not compiled)."""
+        return self._index[pattern.lower()]
+
+    def _build(self) -> None:
+        """Build the trie, failure links, and full transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] += (index,)
+
+        # Breadth-first so each failure target is complete before its use
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                outputs[child] += outputs[fail[child]]
+                queue.append(child)
+            if state:
+                table = dict(delta[fail[state]])
+                table.update(goto[state])
+                delta[state] = table
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield every keyword occurrence in text.
+
+        Args:
+            text: Text to scan (lowercase it first for case-insensitive use)
+
+        Yields:
+            (start_position, pattern_index) in order of end position
+        """
+        delta = self._delta
+        outputs = self._outputs
+        patterns = self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    yield position - len(patterns[index]) + 1, index
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """Return all (start_position, pattern_index) matches as a list."""
+        return list(self.iter_matches(text))
+
+    def count(self, text: str) -> List[int]:
+        """
+        Count occurrences of every pattern in one pass.
+
+        Returns:
+            List of counts aligned with self.patterns
+        """
+        counts = [0] * len(self.patterns)
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    counts[index] += 1
+        return counts
@@ -495,40 +495,22 @@ def create_runtime(
     return ClaudeRuntime(cfg, **kwargs)
 
 
-# Evaluate contract - THE SECOND THIN WAIST CONTRACT
-def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[str, float]:
+def aggregate_outcomes(runtime: Any, results: List[ExecutionResult]) -> Dict[str, float]:
     """
-    THE SECOND THIN WAIST CONTRACT - Evaluate configuration vector.
-
-    This function signature NEVER changes:
-        evaluate(config_vector) -> outcomes_vector
-
-    GlobalMOO calls this to evaluate candidate configurations.
+    Reduce per-task execution results to the evaluate() outcome metrics.
 
     Args:
-        config_vector: 14-dimensional configuration vector
-        tasks: List of task dicts with 'task', 'task_type', 'expected' keys
+        runtime: Runtime that produced the results (for its VERIX validator)
+        results: One ExecutionResult per task, in task order
 
     Returns:
-        Dict with outcome metrics:
-        - task_accuracy: 0.0-1.0
-        - token_efficiency: 0.0-1.0 (lower tokens = higher efficiency)
-        - edge_robustness: 0.0-1.0
-        - epistemic_consistency: 0.0-1.0
+        Outcome dict (see evaluate())
     """
-    from .config import VectorCodec
-
-    # Decode config from vector
-    config = VectorCodec.decode(config_vector)
-
-    # Create runtime (mock for now, real API would be used in production)
-    runtime = create_runtime(config, use_mock=True)
-
     # Initialize outcome accumulators
     total_accuracy = 0.0
     total_tokens = 0
     total_validity = 0.0
-    task_count = len(tasks)
+    task_count = len(results)
 
     if task_count == 0:
         return {
@@ -538,13 +520,7 @@ def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[st
             "epistemic_consistency": 0.0,
         }
 
-    # Evaluate each task
-    for task_data in tasks:
-        task = task_data.get("task", "")
-        task_type = task_data.get("task_type", "default")
-
-        result = runtime.execute(task, task_type)
-
+    for result in results:
         if result.success:
             # Accuracy: based on VERIX validity
             total_accuracy += 1.0 if result.is_valid else 0.5
@@ -577,3 +553,34 @@ def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[st
         "edge_robustness": edge_robustness,
         "epistemic_consistency": epistemic_consistency,
     }
+
+
+# Evaluate contract - THE SECOND THIN WAIST CONTRACT
+def evaluate(config_vector: List[float], tasks: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    THE SECOND THIN WAIST CONTRACT - Evaluate configuration vector.
+
+    This function signature NEVER changes:
+        evaluate(config_vector) -> outcomes_vector
+
+    GlobalMOO calls this to evaluate candidate configurations.
+
+    Tasks run concurrently on the shared EvaluationEngine (bounded
+    concurrency, rate limiting, timeouts, retries); see
+    core/evaluation_engine.py to configure it or to evaluate many
+    config vectors at once.
+
+    Args:
+        config_vector: 14-dimensional configuration vector
+        tasks: List of task dicts with 'task', 'task_type', 'expected' keys
+
+    Returns:
+        Dict with outcome metrics:
+        - task_accuracy: 0.0-1.0
+        - token_efficiency: 0.0-1.0 (lower tokens = higher efficiency)
+        - edge_robustness: 0.0-1.0
+        - epistemic_consistency: 0.0-1.0
+    """
+    from .evaluation_engine import get_evaluation_engine
+
+    return get_evaluation_engine().evaluate(config_vector, tasks)
@@ -33,12 +33,15 @@ Protocol:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Protocol, runtime_checkable, Tuple
-from dataclasses import dataclass
+from collections import Counter
+from functools import cached_property
+from typing import Any, List, Dict, Optional, Protocol, Sequence, runtime_checkable, Tuple, Union
+from dataclasses import dataclass, field
 import re
 import threading
 
 from .config import FrameworkConfig
+from .keyword_automaton import KeywordAutomaton
 
 
 # =============================================================================
@@ -73,6 +76,128 @@ class FrameWeightViolation(Exception):
     pass
 
 
+# =============================================================================
+# SHARED RESPONSE FEATURES
+# =============================================================================
+# Every frame scores a response by (a) which of its markers appear and (b) a
+# density estimate from word/sentence counts. ResponseFeatures computes each
+# of those inputs at most once per response and shares it across frames.
+# =============================================================================
+
+# Bracket markers such as "[witnessed]" or "[root:" are read with one scan
+_BRACKET_TOKEN = re.compile(r"\[[^\[\]\s:]*[:\]]")
+_SENTENCE_END = re.compile(r"[.!?]+")
+_WORD = re.compile(r"\w+")
+
+# Characters that re.IGNORECASE matches against ASCII letters but that
+# str.lower() maps elsewhere; applied before lower() in _fold_word()
+_IGNORECASE_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _fold_word(word: str) -> str:
+    """Lowercase a word the way re.IGNORECASE compares it to ASCII keywords."""
+    if word.isascii():
+        return word.lower()
+    return word.translate(_IGNORECASE_FOLDS).lower()
+
+
+class ResponseFeatures:
+    """
+    Per-response features shared by all frame scorers.
+
+    Each feature is computed lazily on first use and cached, so scoring a
+    single frame costs no more than it needs while scoring all frames
+    lowercases and scans the response only once.
+
+    Attributes:
+        text: Original response text
+        lower: Lowercased response text
+        sentence_spans: (start, end) span of each sentence
+        sentence_end_count: Number of [.!?]+ runs
+        word_counts: Counter of \\w+ words (original case)
+        folded_word_counts: Counter of case-folded \\w+ words
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._pattern_counts: Dict[Any, int] = {}
+
+    @classmethod
+    def from_response(cls, response: Union[str, "ResponseFeatures"]) -> "ResponseFeatures":
+        """Wrap a response string (features pass through unchanged)."""
+        if isinstance(response, ResponseFeatures):
+            return response
+        return cls(response)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def _sentence_end_spans(self) -> List[Tuple[int, int]]:
+        return [match.span() for match in _SENTENCE_END.finditer(self.text)]
+
+    @property
+    def sentence_end_count(self) -> int:
+        return len(self._sentence_end_spans)
+
+    @cached_property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        spans = []
+        start = 0
+        for _, end in self._sentence_end_spans:
+            spans.append((start, end))
+            start = end
+        if self.text[start:].strip():
+            spans.append((start, len(self.text)))
+        return spans
+
+    @cached_property
+    def _bracket_tokens(self) -> Counter:
+        return Counter(_BRACKET_TOKEN.findall(self.lower))
+
+    def marker_count(self, marker: str) -> int:
+        """
+        Count occurrences of a (case-insensitive) compliance marker.
+
+        Bracket markers come from the shared bracket-token scan; any other
+        marker falls back to a substring count.
+        """
+        marker = marker.lower()
+        if _BRACKET_TOKEN.fullmatch(marker):
+            return self._bracket_tokens[marker]
+        return self.lower.count(marker)
+
+    def markers_present(self, markers: Sequence[str]) -> int:
+        """Number of distinct markers that appear at least once."""
+        return sum(1 for marker in markers if self.marker_count(marker))
+
+    @cached_property
+    def word_counts(self) -> Counter:
+        return Counter(_WORD.findall(self.text))
+
+    @cached_property
+    def folded_word_counts(self) -> Counter:
+        folded: Counter = Counter()
+        for word, count in self.word_counts.items():
+            folded[_fold_word(word)] += count
+        return folded
+
+    def count_words(self, words: Sequence[str]) -> int:
+        """Count whole-word occurrences of any of words (case-insensitive)."""
+        folded = self.folded_word_counts
+        return sum(folded[word] for word in words)
+
+    def count_pattern(self, pattern: "re.Pattern") -> int:
+        """Count non-overlapping matches of a compiled pattern (cached)."""
+        if pattern not in self._pattern_counts:
+            self._pattern_counts[pattern] = len(pattern.findall(self.text))
+        return self._pattern_counts[pattern]
+
+
+ResponseLike = Union[str, ResponseFeatures]
+
+
 @runtime_checkable
 class CognitiveFrame(Protocol):
     """
@@ -98,6 +223,10 @@ class CognitiveFrame(Protocol):
         """Score how well response adheres to frame (0.0 - 1.0)."""
         ...
 
+    def score_features(self, features: ResponseFeatures) -> float:
+        """Score precomputed ResponseFeatures (same result as score_response)."""
+        ...
+
 
 @dataclass
 class EvidentialFrame:
@@ -139,10 +268,13 @@ DO NOT make claims without evidence markers. Every factual statement needs a sou
 
     def score_response(self, response: str) -> float:
         """Score based on marker usage density."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Estimate number of claims (sentences that could be factual)
-        sentences = len(re.findall(r'[.!?]+', response))
+        sentences = features.sentence_end_count
         claim_sentences = max(1, sentences * 0.6)  # Assume 60% are factual claims
 
         # Score is ratio of marked claims
@@ -209,13 +341,21 @@ DO NOT describe actions without aspect markers. Every verb needs completion stat
     def compliance_markers(self) -> List[str]:
         return self.MARKERS
 
+    # Whole words counted as trackable verb phrases
+    ACTION_WORDS = (
+        "is", "are", "was", "were", "has", "have", "had",
+        "will", "would", "should", "could", "can", "may", "might",
+    )
+
     def score_response(self, response: str) -> float:
         """Score based on marker usage for action descriptions."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Estimate action descriptions (verb phrases)
-        action_patterns = r'\b(is|are|was|were|has|have|had|will|would|should|could|can|may|might)\b'
-        action_count = len(re.findall(action_patterns, response, re.IGNORECASE))
+        action_count = features.count_words(self.ACTION_WORDS)
         expected_markers = max(1, action_count * 0.3)  # 30% of verb phrases are trackable
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -280,13 +420,21 @@ When introducing technical terms, show their compositional structure.
     def compliance_markers(self) -> List[str]:
         return self.MARKERS
 
+    # CamelCase words; any word of 8+ characters also counts as technical
+    CAMEL_CASE = re.compile(r'[A-Z][a-z]+[A-Z][a-z]+')
+
     def score_response(self, response: str) -> float:
         """Score based on decomposition marker usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Estimate complex terms (multi-syllable technical words)
-        technical_pattern = r'\b[A-Z][a-z]+[A-Z][a-z]+\b|\b\w{8,}\b'
-        technical_count = len(re.findall(technical_pattern, response))
+        technical_count = sum(
+            count for word, count in features.word_counts.items()
+            if len(word) >= 8 or self.CAMEL_CASE.fullmatch(word)
+        )
         expected_markers = max(1, technical_count * 0.2)  # 20% should be decomposed
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -351,13 +499,20 @@ Start with primitives, then show how they compose into the complex concept.
     def compliance_markers(self) -> List[str]:
         return self.MARKERS
 
+    # Multi-word definition phrases; "means" is counted as a single word
+    DEFINITION_PHRASES = re.compile(r'\b(?:is a|refers to|defined as)\b', re.IGNORECASE)
+
     def score_response(self, response: str) -> float:
         """Score based on compositional marker usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Estimate definable concepts
-        definition_triggers = r'\b(is a|means|refers to|defined as)\b'
-        definition_count = len(re.findall(definition_triggers, response, re.IGNORECASE))
+        definition_count = features.count_words(("means",))
+        if features.count_words(("is", "refers", "defined")):
+            definition_count += features.count_pattern(self.DEFINITION_PHRASES)
         expected_markers = max(1, definition_count * 0.5)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -427,10 +582,13 @@ Always consider: Who will read this? What do they need to know?
 
     def score_response(self, response: str) -> float:
         """Score based on audience awareness markers."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Audience should be set at least once
-        has_audience = "[audience:" in response.lower()
+        has_audience = features.marker_count("[audience:") > 0
         base_score = 0.5 if has_audience else 0.0
 
         # Additional markers add to score
@@ -497,13 +655,19 @@ Never say "some things" or "a few items" - always classify and count precisely.
     def compliance_markers(self) -> List[str]:
         return self.MARKERS
 
+    QUANTIFIER_WORDS = ("some", "few", "many", "several", "multiple")
+
     def score_response(self, response: str) -> float:
         """Score based on classifier usage."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
-        # Estimate countable references
-        number_pattern = r'\b\d+\b|\b(some|few|many|several|multiple)\b'
-        number_count = len(re.findall(number_pattern, response, re.IGNORECASE))
+        # Estimate countable references (whole numbers and quantifiers)
+        number_count = features.count_words(self.QUANTIFIER_WORDS) + sum(
+            count for word, count in features.word_counts.items() if word.isdecimal()
+        )
         expected_markers = max(1, number_count * 0.3)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -569,13 +733,17 @@ Always provide full paths, exact line numbers, or clear directional flow.
     def compliance_markers(self) -> List[str]:
         return self.MARKERS
 
+    LOCATION_WORDS = ("file", "function", "class", "module", "line", "path")
+
     def score_response(self, response: str) -> float:
         """Score based on absolute positioning markers."""
-        marker_count = sum(1 for m in self.MARKERS if m.lower() in response.lower())
+        return self.score_features(ResponseFeatures(response))
+
+    def score_features(self, features: ResponseFeatures) -> float:
+        marker_count = features.markers_present(self.MARKERS)
 
         # Estimate location references
-        location_pattern = r'\b(file|function|class|module|line|path)\b'
-        location_count = len(re.findall(location_pattern, response, re.IGNORECASE))
+        location_count = features.count_words(self.LOCATION_WORDS)
         expected_markers = max(1, location_count * 0.3)
 
         coverage = min(1.0, marker_count / expected_markers)
@@ -602,6 +770,26 @@ This frame derives from Guugu Yimithirr absolute directional system.
 """
 
 
+@dataclass
+class TriggerHits:
+    """
+    Keyword trigger hits for a single frame (FR1.3).
+
+    Attributes:
+        frame: Frame name
+        count: Total number of keyword occurrences
+        positions: (start_position, keyword) for every occurrence, in order
+    """
+    frame: str
+    count: int = 0
+    positions: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def keywords(self) -> List[str]:
+        """Distinct keywords that matched, in first-seen order."""
+        return list(dict.fromkeys(keyword for _, keyword in self.positions))
+
+
 class FrameRegistry:
     """
     Registry of all cognitive frames.
@@ -614,7 +802,11 @@ class FrameRegistry:
     _lock: threading.Lock = threading.Lock()
     _initialized: bool = False
 
-    # FR1.3: Keyword triggers for fast frame detection (first 500 chars)
+    # Compiled KEYWORD_TRIGGERS: (frame names, automaton, owning frames per
+    # pattern index). Built lazily, reset by register() and invalidate_triggers().
+    _trigger_index: Optional[Tuple[List[str], KeywordAutomaton, List[Tuple[str, ...]]]] = None
+
+    # FR1.3: Keyword triggers for fast frame detection
     # Each frame maps to keywords that strongly suggest its activation
     KEYWORD_TRIGGERS: Dict[str, List[str]] = {
         "evidential": [
@@ -676,15 +868,49 @@ class FrameRegistry:
             cls._initialized = True
 
     @classmethod
-    def register(cls, frame: CognitiveFrame) -> None:
+    def register(cls, frame: CognitiveFrame, triggers: Optional[List[str]] = None) -> None:
         """
         Register a cognitive frame.
 
         Args:
             frame: Frame instance to register
+            triggers: Optional keyword triggers for get_active_fast()
         """
         cls._ensure_initialized()
-        cls._frames[frame.name] = frame
+        with cls._lock:
+            cls._frames[frame.name] = frame
+            if triggers is not None:
+                cls.KEYWORD_TRIGGERS[frame.name] = list(triggers)
+            cls._trigger_index = None
+
+    @classmethod
+    def invalidate_triggers(cls) -> None:
+        """Drop the compiled trigger automaton after editing KEYWORD_TRIGGERS."""
+        with cls._lock:
+            cls._trigger_index = None
+
+    @classmethod
+    def _get_trigger_index(cls) -> Tuple[List[str], KeywordAutomaton, List[Tuple[str, ...]]]:
+        """Compile KEYWORD_TRIGGERS into a KeywordAutomaton (cached, thread-safe)."""
+        index = cls._trigger_index
+        if index is not None:
+            return index
+
+        with cls._lock:
+            if cls._trigger_index is None:
+                owners: Dict[str, List[str]] = {}
+                for frame_name, triggers in cls.KEYWORD_TRIGGERS.items():
+                    for trigger in triggers:
+                        frames = owners.setdefault(trigger.lower(), [])
+                        if frame_name not in frames:
+                            frames.append(frame_name)
+                automaton = KeywordAutomaton(owners)
+                cls._trigger_index = (
+                    list(cls.KEYWORD_TRIGGERS),
+                    automaton,
+                    [tuple(owners[pattern]) for pattern in automaton.patterns],
+                )
+            return cls._trigger_index
 
     @classmethod
     def get(cls, name: str) -> CognitiveFrame:
@@ -770,19 +996,52 @@ class FrameRegistry:
         cls._ensure_initialized()
         return list(cls._frames.keys())
 
+    @classmethod
+    def match_triggers(
+        cls,
+        prompt: str,
+        max_chars: Optional[int] = None,
+    ) -> Dict[str, TriggerHits]:
+        """
+        Find every keyword trigger occurrence in one pass (FR1.3).
+
+        KEYWORD_TRIGGERS is compiled once into a KeywordAutomaton, so the
+        cost is linear in the prompt length and independent of the number
+        of frames and keywords.
+
+        Args:
+            prompt: Text to analyze
+            max_chars: Optional limit on characters scanned (default: all)
+
+        Returns:
+            Dict mapping frame_name -> TriggerHits, in KEYWORD_TRIGGERS order
+        """
+        cls._ensure_initialized()
+        frame_names, automaton, owners = cls._get_trigger_index()
+        scan_text = prompt[:max_chars] if max_chars is not None else prompt
+
+        hits = {name: TriggerHits(frame=name) for name in frame_names}
+        patterns = automaton.patterns
+        for start, index in automaton.iter_matches(scan_text.lower()):
+            for frame_name in owners[index]:
+                frame_hits = hits[frame_name]
+                frame_hits.count += 1
+                frame_hits.positions.append((start, patterns[index]))
+        return hits
+
     @classmethod
     def get_active_fast(
         cls,
         prompt: str,
         config: FrameworkConfig,
-        max_chars: int = 500,
+        max_chars: Optional[int] = None,
     ) -> List[CognitiveFrame]:
         """
         Fast frame selection using keyword triggers (FR1.3: Thrashing prevention).
 
-        Instead of O(n) evaluation of all frames against the full prompt,
-        this method uses keyword triggers on the first `max_chars` characters
-        for O(1) amortized lookup.
+        Instead of evaluating every frame against the prompt, this method
+        runs the compiled trigger automaton over the prompt once and
+        activates each frame with at least one keyword hit.
 
         Fallback behavior:
         - If no triggers match, returns [evidential] (safest default)
@@ -791,24 +1050,17 @@ class FrameRegistry:
         Args:
             prompt: The input prompt to analyze
             config: FrameworkConfig specifying which frames are enabled
-            max_chars: Characters to scan for triggers (default 500)
+            max_chars: Optional limit on characters scanned (default: all)
 
         Returns:
             List of activated CognitiveFrame instances
         """
-        cls._ensure_initialized()
-
-        # Scan only first N chars for efficiency
-        scan_text = prompt[:max_chars].lower()
+        hits = cls.match_triggers(prompt, max_chars)
 
         # Find matching frames by keyword triggers
-        matched_frames: List[str] = []
-
-        for frame_name, triggers in cls.KEYWORD_TRIGGERS.items():
-            for trigger in triggers:
-                if trigger in scan_text:
-                    matched_frames.append(frame_name)
-                    break  # One match is enough per frame
+        matched_frames: List[str] = [
+            frame_name for frame_name, frame_hits in hits.items() if frame_hits.count
+        ]
 
         # Fallback to evidential if no matches (Hofstadter base case)
         if not matched_frames:
@@ -829,49 +1081,51 @@ class FrameRegistry:
         return active
 
     @classmethod
-    def score_triggers(cls, prompt: str, max_chars: int = 500) -> Dict[str, int]:
+    def score_triggers(cls, prompt: str, max_chars: Optional[int] = None) -> Dict[str, int]:
         """
         Score all frames by trigger match count (diagnostic utility).
 
         Args:
             prompt: Text to analyze
-            max_chars: Characters to scan
+            max_chars: Optional limit on characters scanned (default: all)
 
         Returns:
-            Dict mapping frame_name -> trigger_match_count
+            Dict mapping frame_name -> number of distinct triggers matched
         """
-        cls._ensure_initialized()
-        scan_text = prompt[:max_chars].lower()
+        hits = cls.match_triggers(prompt, max_chars)
+        return {frame_name: len(frame_hits.keywords) for frame_name, frame_hits in hits.items()}
 
-        scores = {}
-        for frame_name, triggers in cls.KEYWORD_TRIGGERS.items():
-            count = sum(1 for t in triggers if t in scan_text)
-            scores[frame_name] = count
 
-        return scores
+def _score_frame(frame: CognitiveFrame, features: ResponseFeatures) -> float:
+    """Score one frame, falling back to score_response for external frames."""
+    score_features = getattr(frame, "score_features", None)
+    if score_features is not None:
+        return score_features(features)
+    return frame.score_response(features.text)
 
 
-def score_all_frames(response: str, config: FrameworkConfig) -> Dict[str, float]:
+def score_all_frames(response: ResponseLike, config: FrameworkConfig) -> Dict[str, float]:
     """
     Score a response against all active frames.
 
     Args:
-        response: The response text to score
+        response: The response text (or its ResponseFeatures) to score
         config: Configuration specifying active frames
 
     Returns:
         Dict mapping frame names to scores (0.0 - 1.0)
     """
+    features = ResponseFeatures.from_response(response)
     active_frames = FrameRegistry.get_active(config)
-    return {frame.name: frame.score_response(response) for frame in active_frames}
+    return {frame.name: _score_frame(frame, features) for frame in active_frames}
 
 
-def aggregate_frame_score(response: str, config: FrameworkConfig) -> float:
+def aggregate_frame_score(response: ResponseLike, config: FrameworkConfig) -> float:
     """
     Calculate aggregate compliance score across all active frames.
 
     Args:
-        response: The response text to score
+        response: The response text (or its ResponseFeatures) to score
         config: Configuration specifying active frames
 
     Returns:
@@ -883,6 +1137,32 @@ def aggregate_frame_score(response: str, config: FrameworkConfig) -> float:
     return sum(scores.values()) / len(scores)
 
 
+def score_all_frames_batch(responses: Sequence[ResponseLike], config: FrameworkConfig) -> Any:
+    """
+    Score many responses against all active frames.
+
+    Features are extracted once per response and shared by every frame.
+
+    Args:
+        responses: Response texts (or ResponseFeatures) to score
+        config: Configuration specifying active frames
+
+    Returns:
+        float64 NumPy array of shape (len(responses), n_active_frames).
+        Columns follow FrameRegistry.get_active(config) order; the row mean
+        equals aggregate_frame_score() when at least one frame is active.
+    """
+    # Imported here so prompt-time hooks that only need frames skip numpy
+    import numpy as np
+
+    active_frames = FrameRegistry.get_active(config)
+    rows = []
+    for response in responses:
+        features = ResponseFeatures.from_response(response)
+        rows.append([_score_frame(frame, features) for frame in active_frames])
+    return np.array(rows, dtype=np.float64).reshape(len(responses), len(active_frames))
+
+
 def get_combined_activation_instruction(
     config: FrameworkConfig,
     custom_weights: Dict[str, float] = None,
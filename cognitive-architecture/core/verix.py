@@ -327,7 +327,33 @@ class VerixParser:
         """
         Extract all VERIX claims from text.
 
-        Tries L1 format first, then L0 format.
+        L1 claims take precedence; L0 claims are returned only when the
+        text contains no valid L1 claim. Both formats are recognized in a
+        single linear scan by VerixTokenizer.
+
+        Args:
+            text: Text containing VERIX-formatted claims
+
+        Returns:
+            List of parsed VerixClaim objects
+        """
+        return self.stream().close(text)
+
+    def stream(self) -> "VerixTokenizer":
+        """
+        Create an incremental tokenizer for streaming responses.
+
+        Returns:
+            VerixTokenizer that accepts chunks via feed() and close()
+        """
+        return VerixTokenizer(self)
+
+    def parse_regex(self, text: str) -> List[VerixClaim]:
+        """
+        Reference implementation using L1_PATTERN / L0_PATTERN.
+
+        Kept for equivalence testing and benchmarking against the
+        tokenizer. Backtracks on long lines, so prefer parse().
 
         Args:
             text: Text containing VERIX-formatted claims
@@ -367,35 +393,50 @@ class VerixParser:
 
     def _parse_l1_match(self, match: re.Match) -> Optional[VerixClaim]:
         """Parse an L1 format regex match into VerixClaim."""
+        return self._build_l1_claim(
+            meta=match.group("meta"),
+            agent=match.group("agent"),
+            claim_id=match.group("claim_id"),
+            illocution=match.group("illocution"),
+            affect=match.group("affect"),
+            content=match.group("content"),
+            ground=match.group("ground"),
+            confidence=match.group("confidence"),
+            state=match.group("state"),
+            raw_text=match.group(0),
+        )
+
+    def _build_l1_claim(
+        self,
+        meta: Optional[str],
+        agent: Optional[str],
+        claim_id: Optional[str],
+        illocution: str,
+        affect: str,
+        content: str,
+        ground: Optional[str],
+        confidence: Optional[str],
+        state: Optional[str],
+        raw_text: str,
+    ) -> Optional[VerixClaim]:
+        """Build a VerixClaim from raw L1 field strings (None if invalid)."""
         try:
             # Extract meta-level if present (FR2.3)
-            meta_str = match.group("meta")
-            meta_level = MetaLevel.from_string(meta_str)
+            meta_level = MetaLevel.from_string(meta)
 
             # Extract agent if present (FR2.1)
-            agent_str = match.group("agent")
-            agent = Agent(agent_str.lower()) if agent_str else None
-
-            claim_id = match.group("claim_id")  # May be None if not present
-            illocution = Illocution(match.group("illocution").lower())
-            affect = Affect(match.group("affect").lower())
-            content = match.group("content").strip()
-            ground = match.group("ground")
-            confidence_str = match.group("confidence")
-            confidence = float(confidence_str) if confidence_str else 0.5
-            state_str = match.group("state")
-            state = State(state_str.lower()) if state_str else State.PROVISIONAL
+            agent_value = Agent(agent.lower()) if agent else None
 
             return VerixClaim(
-                illocution=illocution,
-                affect=affect,
-                content=content,
+                illocution=Illocution(illocution.lower()),
+                affect=Affect(affect.lower()),
+                content=content.strip(),
                 ground=ground,
-                confidence=confidence,
-                state=state,
-                raw_text=match.group(0),
-                claim_id=claim_id,
-                agent=agent,
+                confidence=float(confidence) if confidence else 0.5,
+                state=State(state.lower()) if state else State.PROVISIONAL,
+                raw_text=raw_text,
+                claim_id=claim_id,  # May be None if not present
+                agent=agent_value,
                 meta_level=meta_level,
             )
         except (ValueError, KeyError):
@@ -403,51 +444,480 @@ class VerixParser:
 
     def _parse_l0_match(self, match: re.Match) -> Optional[VerixClaim]:
         """Parse an L0 format regex match into VerixClaim."""
+        return self._build_l0_claim(
+            agent=match.group("agent"),
+            illocution=match.group("illocution"),
+            affect=match.group("affect"),
+            confidence=match.group("confidence"),
+            content=match.group("content"),
+            raw_text=match.group(0),
+        )
+
+    _L0_AGENTS = {
+        "M": Agent.MODEL,
+        "U": Agent.USER,
+        "S": Agent.SYSTEM,
+        "D": Agent.DOC,
+        "P": Agent.PROCESS,
+    }
+    _L0_ILLOCUTIONS = {
+        "A": Illocution.ASSERT,
+        "?": Illocution.QUERY,
+        "!": Illocution.DIRECT,
+        "C": Illocution.COMMIT,
+        "E": Illocution.EXPRESS,
+    }
+    _L0_AFFECTS = {
+        ".": Affect.NEUTRAL,
+        "+": Affect.POSITIVE,
+        "-": Affect.NEGATIVE,
+        "~": Affect.UNCERTAIN,
+    }
+
+    def _build_l0_claim(
+        self,
+        agent: Optional[str],
+        illocution: str,
+        affect: str,
+        confidence: str,
+        content: str,
+        raw_text: str,
+    ) -> Optional[VerixClaim]:
+        """Build a VerixClaim from raw L0 field strings (None if invalid)."""
         try:
-            agent_map = {
-                "M": Agent.MODEL,
-                "U": Agent.USER,
-                "S": Agent.SYSTEM,
-                "D": Agent.DOC,
-                "P": Agent.PROCESS,
-            }
-            illocution_map = {
-                "A": Illocution.ASSERT,
-                "?": Illocution.QUERY,
-                "!": Illocution.DIRECT,
-                "C": Illocution.COMMIT,
-                "E": Illocution.EXPRESS,
-            }
-            affect_map = {
-                ".": Affect.NEUTRAL,
-                "+": Affect.POSITIVE,
-                "-": Affect.NEGATIVE,
-                "~": Affect.UNCERTAIN,
-            }
-
-            # Extract agent if present (FR2.1)
-            agent_char = match.group("agent")
-            agent = agent_map.get(agent_char) if agent_char else None
-
-            illocution = illocution_map[match.group("illocution")]
-            affect = affect_map[match.group("affect")]
-            confidence = int(match.group("confidence")) / 100.0
-            content = match.group("content").strip()
-
             return VerixClaim(
-                illocution=illocution,
-                affect=affect,
-                content=content,
+                illocution=self._L0_ILLOCUTIONS[illocution],
+                affect=self._L0_AFFECTS[affect],
+                content=content.strip(),
                 ground=None,  # L0 doesn't include ground
-                confidence=confidence,
+                confidence=int(confidence) / 100.0,
                 state=State.PROVISIONAL,  # L0 doesn't include state
-                raw_text=match.group(0),
-                agent=agent,
+                raw_text=raw_text,
+                # Extract agent if present (FR2.1)
+                agent=self._L0_AGENTS.get(agent) if agent else None,
             )
         except (ValueError, KeyError):
             return None
 
 
+class _NeedMore(Exception):
+    """Raised by VerixTokenizer when a token runs past the buffered text."""
+
+
+class VerixTokenizer:
+    """
+    Linear-time incremental tokenizer for L0 and L1 VERIX claims.
+
+    Produces exactly the claims VerixParser.parse_regex() would produce for
+    the same text, without the backtracking of L1_PATTERN's lazy content
+    group. L1 candidates are located with str.find('['); each candidate is
+    decided by an anchored header match, a jump to the few positions where
+    content may end, and an anchored suffix match. L0 lines are checked as
+    they complete. Both formats are collected in the same scan.
+
+    Streaming usage:
+        tokenizer = parser.stream()
+        for chunk in response_chunks:
+            for claim in tokenizer.feed(chunk):
+                handle(claim)
+        for claim in tokenizer.close():
+            handle(claim)
+
+    L1 claims are emitted as soon as they are complete. L0 claims are only
+    valid when the whole text holds no L1 claim, so they are held back
+    until close() (and dropped as soon as an L1 claim appears).
+    """
+
+    _WS_RUN = re.compile(r"\s*")
+    _WORD_RUN = re.compile(r"\w*")
+    _ID_RUN = re.compile(r"[\w\-]*")
+    _CONF_RUN = re.compile(r"[\d.]*")
+    _DIGIT_RUN = re.compile(r"\d*")
+    # The header and the suffix sequence are matched with anchored patterns.
+    # Neither contains a lazy group, so each attempt is bounded by the length
+    # of the markers it reads. While streaming, _TAIL is replaced by _tail(),
+    # which can tell a real end-of-line from the end of the buffer.
+    _HEADER = re.compile(
+        r'(?:\[(meta(?::verix)?)\]\s*)?'
+        r'(?:\[agent:(\w+)\]\s*)?'
+        r'(?:\[id:([\w\-]+)\]\s*)?'
+        r'\[(\w+)\|(\w+)\]'
+    )
+    _TAIL = re.compile(
+        r'(?:\s*\[ground:([^\]]+)\])?'
+        r'(?:\s*\[conf:([\d.]+)\])?'
+        r'(?:\s*\[state:(\w+)\])?'
+        r'\s*$',
+        re.MULTILINE
+    )
+    # Positions where lazy L1 content may stop: before a marker, or before
+    # the whitespace that ends the line. Any other position fails the tail.
+    _CONTENT_STOP = re.compile(r"\s*\[|[^\S\n]*(?:\n|\Z)")
+
+    # Trim consumed text from the buffer once it grows past this size
+    _TRIM_THRESHOLD = 1 << 12
+
+    def __init__(self, parser: VerixParser):
+        """
+        Initialize tokenizer.
+
+        Args:
+            parser: VerixParser used to build claims from raw fields
+        """
+        self._parser = parser
+        self._buf = ""
+        self._final = False
+        self._l1_pos = 0        # Next position to search for an L1 claim
+        self._l0_pos = 0        # Start of the next unscanned line
+        self._l0_claims: List[VerixClaim] = []
+        self._has_l1 = False
+        self._stalled = False   # L1 scan is waiting on text after a newline
+        self._close_cache = (0, -1, 0)  # (search_from, found_at, buf_len)
+
+    def feed(self, chunk: str) -> List[VerixClaim]:
+        """
+        Add a chunk of text and return L1 claims completed by it.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Newly completed L1 claims, in order
+        """
+        if self._final:
+            raise ValueError("feed() called after close()")
+        if not chunk:
+            return []
+        self._buf += chunk
+        # Every claim ends at a newline (or end of text), so a chunk
+        # without one cannot complete anything unless a claim was already
+        # waiting on the text that follows a newline.
+        if "\n" not in chunk and not self._stalled:
+            return []
+        claims = self._scan()
+        self._trim()
+        return claims
+
+    def close(self, chunk: str = "") -> List[VerixClaim]:
+        """
+        Finish the stream and return all remaining claims.
+
+        Args:
+            chunk: Optional final piece of the response
+
+        Returns:
+            Remaining L1 claims, or the buffered L0 claims if the text
+            contained no L1 claim at all
+        """
+        if self._final:
+            return []
+        self._buf += chunk
+        self._final = True
+        claims = self._scan()
+        if not self._has_l1:
+            claims.extend(self._l0_claims)
+        self._l0_claims = []
+        return claims
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> List[VerixClaim]:
+        """Advance both the L1 and L0 cursors as far as the buffer allows."""
+        claims = []
+        buf = self._buf
+        pos = self._l1_pos
+        stalled = False
+        while True:
+            start = buf.find("[", pos)
+            if start == -1:
+                pos = len(buf)
+                break
+            try:
+                result = self._match_l1(start)
+            except _NeedMore:
+                pos = start
+                stalled = buf.find("\n", start) != -1
+                break
+            if result is None:
+                pos = start + 1
+                continue
+            end, claim = result
+            pos = end
+            if claim is not None:
+                claims.append(claim)
+        self._l1_pos = pos
+        self._stalled = stalled
+
+        if claims and not self._has_l1:
+            self._has_l1 = True
+            self._l0_claims = []
+        if not self._has_l1:
+            self._scan_l0()
+        return claims
+
+    def _scan_l0(self) -> None:
+        """Check every complete line for the L0 format."""
+        buf = self._buf
+        line = self._l0_pos
+        n = len(buf)
+        while line < n:
+            line_end = buf.find("\n", line)
+            if line_end == -1:
+                if not self._final:
+                    break
+                line_end = n
+            claim = self._match_l0(line, line_end)
+            if claim is not None:
+                self._l0_claims.append(claim)
+            line = line_end + 1
+        self._l0_pos = line
+
+    def _match_l0(self, start: int, end: int) -> Optional[VerixClaim]:
+        """Match `[MUSDP]?[A?!CE][.+-~]\\d+:.+` against buf[start:end]."""
+        buf = self._buf
+        i = start
+        agent = None
+        if i < end and buf[i] in self._parser._L0_AGENTS:
+            agent = buf[i]
+            i += 1
+        if i >= end or buf[i] not in self._parser._L0_ILLOCUTIONS:
+            return None
+        illocution = buf[i]
+        i += 1
+        if i >= end or buf[i] not in self._parser._L0_AFFECTS:
+            return None
+        affect = buf[i]
+        i += 1
+        digits_end = self._DIGIT_RUN.match(buf, i, end).end()
+        if digits_end == i or digits_end + 1 >= end or buf[digits_end] != ":":
+            return None
+        return self._parser._build_l0_claim(
+            agent=agent,
+            illocution=illocution,
+            affect=affect,
+            confidence=buf[i:digits_end],
+            content=buf[digits_end + 1:end],
+            raw_text=buf[start:end],
+        )
+
+    def _match_l1(self, start: int) -> Optional[Tuple[int, Optional[VerixClaim]]]:
+        """
+        Match L1_PATTERN anchored at buf[start] == '['.
+
+        Returns:
+            (match_end, claim) on a match, claim being None when the fields
+            are not valid enum values; None when nothing matches here
+        """
+        buf = self._buf
+        header = self._HEADER.match(buf, start)
+        if header is None:
+            # A header that ends with ']' cannot be undone by more text,
+            # but a failed one may just be truncated.
+            if not self._final:
+                self._header(start)
+            return None
+        meta, agent, claim_id, illocution, affect = header.groups()
+        marker_end = header.end()
+
+        # Content start: greedy whitespace, giving back one non-newline
+        # whitespace character when only whitespace remains.
+        content_start = self._ws(marker_end)
+        if content_start == len(buf):
+            content_start = marker_end - 1
+            for i in range(len(buf) - 1, marker_end - 1, -1):
+                if buf[i] != "\n":
+                    content_start = i
+                    break
+            if content_start < marker_end:
+                return None
+
+        # Lazy content: stop at the first candidate position where the
+        # optional suffixes and end-of-line can be matched.
+        e = content_start + 1
+        while True:
+            e = self._CONTENT_STOP.search(buf, e).start()
+            if self._final:
+                match = self._TAIL.match(buf, e)
+                tail = match and match.groups() + (match.end(),)
+            else:
+                tail = self._tail(e)
+            if tail:
+                break
+            e = self._ws(e) + 1
+
+        ground, confidence, state, end = tail
+        claim = self._parser._build_l1_claim(
+            meta=meta,
+            agent=agent,
+            claim_id=claim_id,
+            illocution=illocution,
+            affect=affect,
+            content=buf[content_start:e],
+            ground=ground,
+            confidence=confidence,
+            state=state,
+            raw_text=buf[start:end],
+        )
+        return end, claim
+
+    def _header(self, p: int) -> Optional[Tuple[Optional[str], ...]]:
+        """
+        Streaming equivalent of _HEADER.match(buf, p).
+
+        Raises _NeedMore when the header may still complete with more text.
+        """
+        buf = self._buf
+
+        # Optional prefixes in fixed order
+        meta = None
+        if self._literal(p, "[meta:verix]"):
+            meta, p = "meta:verix", self._ws(p + 12)
+        elif self._literal(p, "[meta]"):
+            meta, p = "meta", self._ws(p + 6)
+
+        agent = None
+        if self._literal(p, "[agent:"):
+            value_end = self._run(self._WORD_RUN, p + 7)
+            if value_end == p + 7 or not self._char_is(value_end, "]"):
+                return None
+            agent, p = buf[p + 7:value_end], self._ws(value_end + 1)
+
+        claim_id = None
+        if self._literal(p, "[id:"):
+            value_end = self._run(self._ID_RUN, p + 4)
+            if value_end == p + 4 or not self._char_is(value_end, "]"):
+                return None
+            claim_id, p = buf[p + 4:value_end], self._ws(value_end + 1)
+
+        # Required [illocution|affect]
+        if not self._char_is(p, "["):
+            return None
+        ill_end = self._run(self._WORD_RUN, p + 1)
+        if ill_end == p + 1 or not self._char_is(ill_end, "|"):
+            return None
+        aff_end = self._run(self._WORD_RUN, ill_end + 1)
+        if aff_end == ill_end + 1 or not self._char_is(aff_end, "]"):
+            return None
+        return meta, agent, claim_id, buf[p + 1:ill_end], buf[ill_end + 1:aff_end], aff_end + 1
+
+    def _tail(self, p: int) -> Optional[Tuple[Optional[str], Optional[str], Optional[str], int]]:
+        """Streaming equivalent of _TAIL.match(buf, p), in regex try-order."""
+        ground = self._ground(p)
+        if ground is not None:
+            rest = self._after_ground(ground[1])
+            if rest is not None:
+                return (ground[0],) + rest
+        rest = self._after_ground(p)
+        if rest is not None:
+            return (None,) + rest
+        return None
+
+    def _after_ground(self, p: int) -> Optional[Tuple[Optional[str], Optional[str], int]]:
+        conf = self._marker(p, "[conf:", self._CONF_RUN)
+        if conf is not None:
+            rest = self._after_conf(conf[1])
+            if rest is not None:
+                return (conf[0],) + rest
+        rest = self._after_conf(p)
+        if rest is not None:
+            return (None,) + rest
+        return None
+
+    def _after_conf(self, p: int) -> Optional[Tuple[Optional[str], int]]:
+        state = self._marker(p, "[state:", self._WORD_RUN)
+        if state is not None:
+            end = self._line_end(state[1])
+            if end is not None:
+                return state[0], end
+        end = self._line_end(p)
+        if end is not None:
+            return None, end
+        return None
+
+    def _ground(self, p: int) -> Optional[Tuple[str, int]]:
+        """Match `\\s*\\[ground:([^\\]]+)\\]` at p."""
+        p = self._ws(p)
+        if not self._literal(p, "[ground:"):
+            return None
+        close = self._find_close(p + 8)
+        if close <= p + 8:
+            return None
+        return self._buf[p + 8:close], close + 1
+
+    def _marker(self, p: int, prefix: str, value_run: "re.Pattern") -> Optional[Tuple[str, int]]:
+        """Match `\\s*<prefix>(value+)\\]` at p."""
+        p = self._ws(p)
+        if not self._literal(p, prefix):
+            return None
+        value_start = p + len(prefix)
+        value_end = self._run(value_run, value_start)
+        if value_end == value_start or not self._char_is(value_end, "]"):
+            return None
+        return self._buf[value_start:value_end], value_end + 1
+
+    def _line_end(self, p: int) -> Optional[int]:
+        """Match `\\s*$` (MULTILINE) at p, returning the greedy end."""
+        ws_end = self._ws(p)
+        if ws_end == len(self._buf):
+            return ws_end
+        newline = self._buf.rfind("\n", p, ws_end)
+        return newline if newline != -1 else None
+
+    # ------------------------------------------------------------------
+    # Buffer primitives (raise _NeedMore when the answer depends on
+    # text that has not arrived yet)
+    # ------------------------------------------------------------------
+
+    def _ws(self, p: int) -> int:
+        end = self._WS_RUN.match(self._buf, p).end()
+        if end == len(self._buf) and not self._final:
+            raise _NeedMore
+        return end
+
+    def _run(self, pattern: "re.Pattern", p: int) -> int:
+        end = pattern.match(self._buf, p).end()
+        if end == len(self._buf) and not self._final:
+            raise _NeedMore
+        return end
+
+    def _literal(self, p: int, text: str) -> bool:
+        buf = self._buf
+        if buf.startswith(text, p):
+            return True
+        if not self._final and len(buf) - p < len(text) and text.startswith(buf[p:]):
+            raise _NeedMore
+        return False
+
+    def _char_is(self, p: int, char: str) -> bool:
+        if p < len(self._buf):
+            return self._buf[p] == char
+        if not self._final:
+            raise _NeedMore
+        return False
+
+    def _find_close(self, p: int) -> int:
+        searched_from, found, buf_len = self._close_cache
+        stale = found == -1 and buf_len != len(self._buf)
+        if stale or searched_from > p or -1 < found < p:
+            found = self._buf.find("]", p)
+            self._close_cache = (p, found, len(self._buf))
+        if found == -1 and not self._final:
+            raise _NeedMore
+        return found
+
+    def _trim(self) -> None:
+        """Drop text that neither cursor can revisit."""
+        keep_from = self._l1_pos if self._has_l1 else min(self._l1_pos, self._l0_pos)
+        if keep_from < self._TRIM_THRESHOLD:
+            return
+        self._buf = self._buf[keep_from:]
+        self._l1_pos -= keep_from
+        self._l0_pos = max(0, self._l0_pos - keep_from)
+        self._close_cache = (0, -1, 0)
+
+
 class VerixValidator:
     """
     Validate VERIX compliance in responses.
@@ -17,9 +17,12 @@ from pathlib import Path
 from enum import Enum
 import sys
 
+import numpy as np
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec
+from optimization.telemetry_frame import TelemetryFrame, group_means
 
 
 class ProposalType(Enum):
@@ -92,7 +95,18 @@ class EvolutionProposal:
 
 
 class TelemetryAggregator:
-    """Aggregate telemetry data for analysis."""
+    """
+    Aggregate telemetry data for analysis.
+
+    Points are kept both as TelemetryPoint objects (returned by get_points)
+    and in a columnar TelemetryFrame that backs filtering and group-by
+    aggregation. Points are treated as immutable once recorded.
+    """
+
+    FRAME_NAMES = [
+        "evidential", "aspectual", "morphological",
+        "compositional", "honorific", "classifier", "spatial"
+    ]
 
     def __init__(self, storage_dir: Optional[Path] = None):
         """
@@ -107,10 +121,24 @@ class TelemetryAggregator:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self._points: List[TelemetryPoint] = []
+        self._frame = TelemetryFrame()
+
+    @property
+    def frame(self) -> TelemetryFrame:
+        """Columnar view of all recorded points (row i is get_points()[i])."""
+        return self._frame
 
     def record(self, point: TelemetryPoint) -> None:
         """Record a telemetry point."""
         self._points.append(point)
+        self._frame.append(point.config_vector, point.outcomes, point.task_type, point.timestamp)
+
+    def record_many(self, points: List[TelemetryPoint]) -> None:
+        """Record many telemetry points in one columnar append."""
+        self._points.extend(points)
+        self._frame.extend(
+            (p.config_vector, p.outcomes, p.task_type, p.timestamp) for p in points
+        )
 
     def record_outcome(
         self,
@@ -141,15 +169,41 @@ class TelemetryAggregator:
             since: Only points after this timestamp
             task_type: Only points for this task type
         """
+        if since is None and task_type is None:
+            return self._points
+
         points = self._points
+        return [points[i] for i in self._frame.select(since, task_type)]
 
-        if since is not None:
-            points = [p for p in points if p.timestamp >= since]
+    def _group_outcomes(
+        self,
+        codes: np.ndarray,
+        group_names: List[str],
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Average outcomes per group, matching the per-point semantics.
 
-        if task_type is not None:
-            points = [p for p in points if p.task_type == task_type]
+        Each group reports the metrics of its first point, averaged over
+        all of its points with missing metrics counted as 0.0.
+        """
+        frame = self._frame
+        means, counts = group_means(
+            codes, len(group_names), np.where(frame.present, frame.outcomes, 0.0)
+        )
+        first_rows = np.full(len(group_names), len(frame), dtype=np.intp)
+        np.minimum.at(first_rows, codes, np.arange(len(codes)))
+        column = {metric: j for j, metric in enumerate(frame.metrics)}
 
-        return points
+        aggregated = {}
+        for group in np.argsort(first_rows, kind="stable"):
+            if counts[group] == 0:
+                continue
+            first = self._points[first_rows[group]]
+            aggregated[group_names[group]] = {
+                key: float(means[group, column[key]])
+                for key in first.outcomes
+            }
+        return aggregated
 
     def aggregate_by_cluster(self) -> Dict[str, Dict[str, float]]:
         """
@@ -158,30 +212,27 @@ class TelemetryAggregator:
         Returns:
             Dict mapping cluster_key -> average outcomes
         """
-        clusters: Dict[str, List[Dict[str, float]]] = {}
-
-        for point in self._points:
-            config = VectorCodec.decode(point.config_vector)
-            cluster_key = VectorCodec.cluster_key(config)
-
-            if cluster_key not in clusters:
-                clusters[cluster_key] = []
-            clusters[cluster_key].append(point.outcomes)
-
-        # Average outcomes per cluster
-        aggregated = {}
-        for cluster_key, outcome_list in clusters.items():
-            if not outcome_list:
-                continue
-
-            avg_outcomes = {}
-            for key in outcome_list[0].keys():
-                values = [o.get(key, 0.0) for o in outcome_list]
-                avg_outcomes[key] = sum(values) / len(values)
-
-            aggregated[cluster_key] = avg_outcomes
-
-        return aggregated
+        frame = self._frame
+        if len(frame) == 0:
+            return {}
+
+        lengths = frame.config_lengths
+        if (lengths != VectorCodec.VECTOR_SIZE).any():
+            # Surface the same error decoding the bad vector would raise
+            bad = int(np.flatnonzero(lengths != VectorCodec.VECTOR_SIZE)[0])
+            VectorCodec.decode(self._points[bad].config_vector)
+
+        # Decode each distinct config once, not once per point
+        first_rows, inverse = frame.distinct_configs()
+        key_codes: Dict[str, int] = {}
+        unique_codes = np.empty(len(first_rows), dtype=np.intp)
+        for u, row in enumerate(first_rows):
+            config = VectorCodec.decode(self._points[row].config_vector)
+            key = VectorCodec.cluster_key(config)
+            unique_codes[u] = key_codes.setdefault(key, len(key_codes))
+
+        codes = unique_codes[inverse]
+        return self._group_outcomes(codes, list(key_codes))
 
     def aggregate_by_frame(self) -> Dict[str, Dict[str, float]]:
         """
@@ -190,37 +241,29 @@ class TelemetryAggregator:
         Returns:
             Dict mapping frame_name -> average outcomes when activated
         """
-        frame_names = [
-            "evidential", "aspectual", "morphological",
-            "compositional", "honorific", "classifier", "spatial"
-        ]
-
-        frame_outcomes: Dict[str, List[Dict[str, float]]] = {
-            f: [] for f in frame_names
-        }
+        frame = self._frame
+        frame_names = self.FRAME_NAMES
+        if len(frame) == 0:
+            return {}
 
-        for point in self._points:
-            config = VectorCodec.decode(point.config_vector)
+        active = frame.config[:, :len(frame_names)] > 0.5
+        present = frame.present
+        values = np.where(present, frame.outcomes, 0.0)
 
-            # Check each frame
-            for i, frame in enumerate(frame_names):
-                is_active = point.config_vector[i] > 0.5
-                if is_active:
-                    frame_outcomes[frame].append(point.outcomes)
+        counts = active.sum(axis=0)
+        sums = active.T.astype(np.float64) @ values
+        first_rows = np.argmax(active, axis=0)
+        column = {metric: j for j, metric in enumerate(frame.metrics)}
 
-        # Average per frame
         aggregated = {}
-        for frame, outcome_list in frame_outcomes.items():
-            if not outcome_list:
+        for i, name in enumerate(frame_names):
+            if counts[i] == 0:
                 continue
-
-            avg_outcomes = {}
-            for key in outcome_list[0].keys():
-                values = [o.get(key, 0.0) for o in outcome_list]
-                avg_outcomes[key] = sum(values) / len(values)
-
-            aggregated[frame] = avg_outcomes
-
+            first = self._points[first_rows[i]]
+            aggregated[name] = {
+                key: float(sums[i, column[key]] / counts[i])
+                for key in first.outcomes
+            }
         return aggregated
 
     def save(self, filename: str = "telemetry.jsonl") -> int:
@@ -247,7 +290,7 @@ class TelemetryAggregator:
         if not filepath.exists():
             return 0
 
-        self._points = []
+        points = []
         with open(filepath) as f:
             for line in f:
                 if line.strip():
@@ -259,8 +302,11 @@ class TelemetryAggregator:
                         timestamp=data["timestamp"],
                         metadata=data.get("metadata", {}),
                     )
-                    self._points.append(point)
+                    points.append(point)
 
+        self._points = []
+        self._frame = TelemetryFrame()
+        self.record_many(points)
         return len(self._points)
 
 
@@ -367,24 +413,14 @@ class DSPyLevel1Analyzer:
         if not cluster_data:
             return proposals
 
-        # Group by VERIX strictness level
-        strictness_outcomes: Dict[int, List[Dict[str, float]]] = {0: [], 1: [], 2: []}
-
-        for point in self.telemetry.get_points():
-            strictness = int(point.config_vector[7])  # Index 7 = verix_strictness
-            if strictness in strictness_outcomes:
-                strictness_outcomes[strictness].append(point.outcomes)
+        # Group by VERIX strictness level (index 7 = verix_strictness)
+        level_means = self._level_means(7, "epistemic_consistency")
 
         # Analyze each level
         best_strictness = 1  # Default
         best_avg = 0.0
 
-        for strictness, outcomes in strictness_outcomes.items():
-            if not outcomes:
-                continue
-
-            avg_consistency = sum(o.get("epistemic_consistency", 0.0) for o in outcomes) / len(outcomes)
-
+        for strictness, avg_consistency in level_means.items():
             if avg_consistency > best_avg:
                 best_avg = avg_consistency
                 best_strictness = strictness
@@ -411,23 +447,14 @@ class DSPyLevel1Analyzer:
         """Analyze compression level impact."""
         proposals = []
 
-        compression_outcomes: Dict[int, List[Dict[str, float]]] = {0: [], 1: [], 2: []}
-
-        for point in self.telemetry.get_points():
-            compression = int(point.config_vector[8])  # Index 8 = compression_level
-            if compression in compression_outcomes:
-                compression_outcomes[compression].append(point.outcomes)
+        # Index 8 = compression_level
+        level_means = self._level_means(8, "token_efficiency")
 
         # Find best for token efficiency
         best_compression = 1
         best_efficiency = 0.0
 
-        for compression, outcomes in compression_outcomes.items():
-            if not outcomes:
-                continue
-
-            avg_efficiency = sum(o.get("token_efficiency", 0.0) for o in outcomes) / len(outcomes)
-
+        for compression, avg_efficiency in level_means.items():
             if avg_efficiency > best_efficiency:
                 best_efficiency = avg_efficiency
                 best_compression = compression
@@ -450,6 +477,29 @@ class DSPyLevel1Analyzer:
 
         return proposals
 
+    def _level_means(self, config_index: int, metric: str) -> Dict[int, float]:
+        """
+        Average a metric per integer level (0-2) of one config dimension.
+
+        Levels with no points are omitted; missing metrics count as 0.0.
+        """
+        frame = self.telemetry.frame
+        if len(frame) == 0:
+            return {}
+
+        levels = np.trunc(frame.config[:, config_index])
+        in_range = (levels >= 0) & (levels <= 2)
+        means, counts = group_means(
+            levels[in_range].astype(np.intp),
+            3,
+            frame.outcome_column(metric, 0.0)[in_range],
+        )
+        return {
+            level: float(means[level, 0])
+            for level in range(3)
+            if counts[level]
+        }
+
     def get_proposals(
         self,
         status: Optional[ProposalStatus] = None,
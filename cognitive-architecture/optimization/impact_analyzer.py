@@ -19,6 +19,7 @@ from pathlib import Path
 # Try to import numpy, fallback to pure Python if not available
 try:
     import numpy as np
+    from optimization.telemetry_frame import TelemetryFrame, masked_correlation
     NUMPY_AVAILABLE = True
 except ImportError:
     NUMPY_AVAILABLE = False
@@ -164,38 +165,33 @@ class ImpactAnalyzer:
         else:
             return self._compute_correlations_pure(points, n_configs, n_outcomes)
 
+    def _telemetry_frame(self, points: List):
+        """Columnar view of the telemetry, reusing the aggregator's frame if it has one."""
+        frame = getattr(self.telemetry, "frame", None)
+        if frame is not None and len(frame) == len(points):
+            return frame
+
+        frame = TelemetryFrame(config_width=len(self.CONFIG_DIMENSIONS))
+        frame.extend((p.config_vector, p.outcomes, p.task_type, p.timestamp) for p in points)
+        return frame
+
     def _compute_correlations_numpy(
         self,
         points: List,
         n_configs: int,
         n_outcomes: int,
     ) -> List[List[float]]:
-        """Compute correlations using numpy."""
-        # Build arrays
-        config_data = np.array([p.config_vector[:n_configs] for p in points])
-        outcome_data = np.array([
-            [p.outcomes.get(m, float('nan')) for m in self.OUTCOME_METRICS]
-            for p in points
-        ])
-
-        correlations = np.zeros((n_configs, n_outcomes))
-
-        for i in range(n_configs):
-            for j in range(n_outcomes):
-                # Filter NaN values
-                mask = ~np.isnan(outcome_data[:, j])
-                if mask.sum() < 10:
-                    correlations[i, j] = 0.0
-                    continue
-
-                x = config_data[mask, i]
-                y = outcome_data[mask, j]
-
-                # Pearson correlation
-                if np.std(x) > 0 and np.std(y) > 0:
-                    correlations[i, j] = np.corrcoef(x, y)[0, 1]
-                else:
-                    correlations[i, j] = 0.0
+        """Compute all correlations at once with the masked correlation kernel."""
+        frame = self._telemetry_frame(points)
+        outcome_data, outcome_mask = frame.outcome_matrix(self.OUTCOME_METRICS)
+        config_data = frame.config[:, :n_configs]
+
+        correlations = masked_correlation(
+            config_data,
+            outcome_data,
+            y_mask=outcome_mask,
+            min_samples=10,
+        )
 
         self._correlation_matrix = correlations.tolist()
         self._extract_impact_factors()
@@ -399,6 +395,12 @@ class ImpactAnalyzer:
 
         points = self.telemetry.get_points()
 
+        if NUMPY_AVAILABLE:
+            # Stable sort on negated accuracy keeps ties in recording order
+            accuracy = self._telemetry_frame(points).outcome_column("task_accuracy", 0.0)
+            top = np.argsort(-accuracy, kind="stable")[:20]
+            return [points[i].config_vector for i in top]
+
         # Sort by task accuracy (high to low)
         ranked = sorted(
             points,
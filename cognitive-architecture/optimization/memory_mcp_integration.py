@@ -500,6 +500,10 @@ class TelemetryAggregatorWithMCP:
     def get_points(self, *args, **kwargs):
         return self.base.get_points(*args, **kwargs)
 
+    @property
+    def frame(self):
+        return self.base.frame
+
     def aggregate_by_cluster(self):
         return self.base.aggregate_by_cluster()
 
@@ -0,0 +1,230 @@
+"""
+Population evaluation backends for the pymoo problems.
+
+pymoo hands a whole population X (n x n_var) to Problem._evaluate. These
+backends turn that into an objective matrix F (n x n_obj):
+
+- VectorizedEvaluator: one NumPy call over the whole population, for the
+  analytic surrogate objectives
+- PoolEvaluator: per-row evaluation fanned out over a process pool, for
+  expensive row functions
+- ConfigCachedEvaluator: decodes each row to a FullConfig and evaluates
+  each distinct config once, caching results across generations. Many
+  continuous vectors decode to the same discrete config, and evaluating
+  a config through the runtime is the expensive part.
+
+Used by:
+- CognitiveProblem5D / CognitiveProblem14D (optimization/two_stage_optimizer.py)
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import FullConfig, VectorCodec
+
+
+OBJECTIVE_NAMES = [
+    "task_accuracy",
+    "token_efficiency",
+    "edge_robustness",
+    "epistemic_consistency",
+]
+
+
+class PopulationEvaluator:
+    """
+    Base class: maps a population matrix to an objective matrix.
+
+    Subclasses implement evaluate(). Instances are callable and usable as
+    context managers so pooled backends release their workers.
+    """
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        return self.evaluate(np.atleast_2d(np.asarray(X, dtype=float)))
+
+    def close(self) -> None:
+        """Release any worker resources (no-op by default)."""
+
+    def __enter__(self) -> "PopulationEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class VectorizedEvaluator(PopulationEvaluator):
+    """Evaluate the whole population with a single batch function."""
+
+    def __init__(self, batch_fn: Callable[[np.ndarray], np.ndarray]):
+        """
+        Args:
+            batch_fn: Function(X (n x n_var)) -> F (n x n_obj)
+        """
+        self.batch_fn = batch_fn
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(self.batch_fn(X), dtype=float)
+
+
+class _Pool:
+    """Lazily created process pool shared by the pooled backends."""
+
+    def __init__(self, max_workers: Optional[int], chunksize: Optional[int]):
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def serial(self) -> bool:
+        return self.max_workers == 1
+
+    def map(self, fn: Callable, items: Sequence) -> List:
+        if self.serial or len(items) <= 1:
+            return [fn(item) for item in items]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = self.chunksize or max(1, len(items) // (workers * 4))
+        return list(self._executor.map(fn, items, chunksize=chunksize))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class PoolEvaluator(PopulationEvaluator):
+    """
+    Evaluate rows in parallel worker processes.
+
+    The row function must be picklable (a module-level function or an
+    instance of a module-level class).
+    """
+
+    def __init__(
+        self,
+        row_fn: Callable[[np.ndarray], Sequence[float]],
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ):
+        """
+        Args:
+            row_fn: Function(x (n_var,)) -> objectives (n_obj,)
+            max_workers: Worker processes (None = CPU count, 1 = serial)
+            chunksize: Rows per task sent to a worker (None = auto)
+        """
+        self.row_fn = row_fn
+        self._pool = _Pool(max_workers, chunksize)
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        return np.array(self._pool.map(self.row_fn, list(X)), dtype=float)
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class ConfigCachedEvaluator(PopulationEvaluator):
+    """
+    Evaluate each distinct decoded FullConfig once.
+
+    Rows are decoded to FullConfig and keyed by the config's canonical
+    vector (VectorCodec.encode). Within a population, duplicate configs
+    are evaluated once; across generations, cached configs are never
+    re-evaluated. Misses can be fanned out over a process pool.
+    """
+
+    def __init__(
+        self,
+        config_fn: Callable[[FullConfig], Sequence[float]],
+        decode: Callable[[np.ndarray], FullConfig],
+        max_workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ):
+        """
+        Args:
+            config_fn: Function(FullConfig) -> objectives (n_obj,)
+            decode: Function(x (n_var,)) -> FullConfig
+            max_workers: Worker processes for cache misses (1 = serial)
+            chunksize: Configs per task sent to a worker (None = auto)
+        """
+        self.config_fn = config_fn
+        self.decode = decode
+        self._pool = _Pool(max_workers, chunksize)
+        self._cache: Dict[Tuple[float, ...], np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def config_key(config: FullConfig) -> Tuple[float, ...]:
+        """Cache key for a config: its canonical 14-dim vector."""
+        return tuple(VectorCodec.encode(config))
+
+    def evaluate(self, X: np.ndarray) -> np.ndarray:
+        keys = []
+        pending: Dict[Tuple[float, ...], FullConfig] = {}
+        for x in X:
+            config = self.decode(x)
+            key = self.config_key(config)
+            keys.append(key)
+            if key not in self._cache and key not in pending:
+                pending[key] = config
+
+        self.misses += len(pending)
+        self.hits += len(keys) - len(pending)
+
+        if pending:
+            results = self._pool.map(self.config_fn, list(pending.values()))
+            for key, objectives in zip(pending, results):
+                self._cache[key] = np.asarray(objectives, dtype=float)
+
+        return np.array([self._cache[key] for key in keys])
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "cached_configs": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class RuntimeObjective:
+    """
+    Adapt the core.runtime.evaluate contract to a pymoo objective row.
+
+    Picklable, so it can run in PoolEvaluator / ConfigCachedEvaluator
+    workers. Returns the objectives negated for minimization.
+    """
+
+    def __init__(self, tasks: List[Dict[str, Any]]):
+        """
+        Args:
+            tasks: Task dicts passed through to core.runtime.evaluate
+        """
+        self.tasks = tasks
+
+    def __call__(self, config: FullConfig) -> List[float]:
+        from core.runtime import evaluate
+
+        outcomes = evaluate(VectorCodec.encode(config), self.tasks)
+        return [-outcomes.get(name, 0.0) for name in OBJECTIVE_NAMES]
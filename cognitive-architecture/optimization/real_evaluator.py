@@ -22,7 +22,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import FullConfig, VectorCodec, FrameworkConfig, PromptConfig
 from core.prompt_builder import PromptBuilder
-from core.verilingua import score_all_frames, aggregate_frame_score
+from core.verilingua import ResponseFeatures, score_all_frames, aggregate_frame_score
 from core.verix import VerixParser, VerixValidator
 from optimization.telemetry_schema import ExecutionTelemetry, TelemetryStore
 
@@ -322,8 +322,9 @@ class RealTaskEvaluator:
         frame_compliance = 0.0
 
         if execution.success and execution.response:
-            frame_scores = score_all_frames(execution.response, config.framework)
-            frame_compliance = aggregate_frame_score(execution.response, config.framework)
+            features = ResponseFeatures(execution.response)
+            frame_scores = score_all_frames(features, config.framework)
+            frame_compliance = aggregate_frame_score(features, config.framework)
 
         # 4. Score VERIX compliance
         verix_compliance = 0.0
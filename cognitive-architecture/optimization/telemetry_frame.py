@@ -0,0 +1,369 @@
+"""
+Columnar telemetry frame for DSPy Level 1 analysis.
+
+Stores telemetry points as NumPy columns instead of a list of dataclasses:
+- config: float32 matrix (n x 14), NaN-padded for short vectors
+- outcomes: float64 matrix (n x metrics) with a presence mask
+- task_codes: int32 categorical codes into task_types
+- timestamps: float64
+
+Columns grow by doubling, so appends are amortized O(1) and bulk loads
+copy each chunk once. Analyses read views of the filled rows and use the
+vectorized kernels below (group means, masked correlation) rather than
+looping over points.
+
+Used by:
+- TelemetryAggregator (optimization/dspy_level1.py)
+- ImpactAnalyzer (optimization/impact_analyzer.py)
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import VectorCodec
+
+
+class TelemetryFrame:
+    """
+    Append-only columnar store of (config_vector, outcomes, task_type, timestamp).
+
+    Outcome metrics are discovered as they are appended; each new metric
+    adds a column that is absent (mask False) for earlier rows.
+
+    Usage:
+        frame = TelemetryFrame()
+        frame.append([1.0] * 14, {"task_accuracy": 0.9}, "debugging", time.time())
+        acc = frame.outcome_column("task_accuracy")
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, config_width: int = VectorCodec.VECTOR_SIZE):
+        """
+        Initialize an empty frame.
+
+        Args:
+            config_width: Number of config dimensions stored per row
+        """
+        self.config_width = config_width
+        self.metrics: List[str] = []
+        self.task_types: List[str] = []
+        self._metric_index: Dict[str, int] = {}
+        self._task_index: Dict[str, int] = {}
+        self._size = 0
+        self._allocate(0, 0)
+
+    def _allocate(self, capacity: int, n_metrics: int) -> None:
+        """Allocate empty columns with the given row and metric capacity."""
+        self._config = np.full((capacity, self.config_width), np.nan, dtype=np.float32)
+        self._lengths = np.zeros(capacity, dtype=np.int32)
+        self._outcomes = np.full((capacity, n_metrics), np.nan, dtype=np.float64)
+        self._present = np.zeros((capacity, n_metrics), dtype=bool)
+        self._task_codes = np.zeros(capacity, dtype=np.int32)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def _reserve(self, rows: int, n_metrics: int) -> None:
+        """Grow columns (by doubling) to hold `rows` rows and `n_metrics` metrics."""
+        capacity, metric_capacity = self._outcomes.shape
+        if rows <= capacity and n_metrics <= metric_capacity:
+            return
+
+        new_capacity = max(capacity, self.INITIAL_CAPACITY)
+        while new_capacity < rows:
+            new_capacity *= 2
+        new_metrics = max(metric_capacity, 1)
+        while new_metrics < n_metrics:
+            new_metrics *= 2
+
+        old = (self._config, self._lengths, self._outcomes,
+               self._present, self._task_codes, self._timestamps)
+        self._allocate(new_capacity, new_metrics)
+        n = self._size
+        self._config[:n] = old[0][:n]
+        self._lengths[:n] = old[1][:n]
+        self._outcomes[:n, :old[2].shape[1]] = old[2][:n]
+        self._present[:n, :old[3].shape[1]] = old[3][:n]
+        self._task_codes[:n] = old[4][:n]
+        self._timestamps[:n] = old[5][:n]
+
+    def _task_code(self, task_type: str) -> int:
+        code = self._task_index.get(task_type)
+        if code is None:
+            code = len(self.task_types)
+            self._task_index[task_type] = code
+            self.task_types.append(task_type)
+        return code
+
+    def _metric_column(self, metric: str) -> int:
+        column = self._metric_index.get(metric)
+        if column is None:
+            column = len(self.metrics)
+            self._metric_index[metric] = column
+            self.metrics.append(metric)
+        return column
+
+    def append(
+        self,
+        config_vector: Sequence[float],
+        outcomes: Dict[str, float],
+        task_type: str,
+        timestamp: float,
+    ) -> None:
+        """Append a single row."""
+        self.extend([(config_vector, outcomes, task_type, timestamp)])
+
+    def extend(
+        self,
+        rows: Iterable[Tuple[Sequence[float], Dict[str, float], str, float]],
+    ) -> None:
+        """
+        Append many rows, growing the columns at most once.
+
+        Args:
+            rows: (config_vector, outcomes, task_type, timestamp) tuples
+        """
+        rows = list(rows)
+        if not rows:
+            return
+
+        width = self.config_width
+
+        # Rows sharing the same metric keys (the common case) are written
+        # as one block per key set
+        by_keys: Dict[Tuple[str, ...], List[int]] = {}
+        for offset, (_, outcomes, _, _) in enumerate(rows):
+            by_keys.setdefault(tuple(outcomes), []).append(offset)
+        for keys in by_keys:
+            for metric in keys:
+                self._metric_column(metric)
+
+        start = self._size
+        end = start + len(rows)
+        self._reserve(end, len(self.metrics))
+
+        lengths = [len(vector) for vector, _, _, _ in rows]
+        self._lengths[start:end] = lengths
+        if all(length == width for length in lengths):
+            self._config[start:end] = [vector for vector, _, _, _ in rows]
+        else:
+            for row, (vector, _, _, _) in enumerate(rows, start):
+                if len(vector):
+                    self._config[row, :min(len(vector), width)] = vector[:width]
+
+        self._task_codes[start:end] = [self._task_code(task_type) for _, _, task_type, _ in rows]
+        self._timestamps[start:end] = [timestamp for _, _, _, timestamp in rows]
+
+        for keys, offsets in by_keys.items():
+            if not keys:
+                continue
+            target = np.asarray(offsets) + start
+            columns = [self._metric_index[metric] for metric in keys]
+            block = np.array([list(rows[i][1].values()) for i in offsets], dtype=np.float64)
+            self._outcomes[np.ix_(target, columns)] = block
+            self._present[np.ix_(target, columns)] = True
+
+        self._size = end
+
+    def clear(self) -> None:
+        """Remove all rows (metric and task-type vocabularies are reset too)."""
+        self.__init__(self.config_width)
+
+    # ------------------------------------------------------------------
+    # Column views (filled rows only, do not mutate)
+    # ------------------------------------------------------------------
+
+    @property
+    def config(self) -> np.ndarray:
+        """float32 (n x config_width) config matrix, NaN where a vector was short."""
+        return self._config[:self._size]
+
+    @property
+    def config_lengths(self) -> np.ndarray:
+        """Original length of each config vector."""
+        return self._lengths[:self._size]
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """float64 (n x len(metrics)) outcome matrix, NaN where absent."""
+        return self._outcomes[:self._size, :len(self.metrics)]
+
+    @property
+    def present(self) -> np.ndarray:
+        """Boolean (n x len(metrics)) mask of which outcomes were recorded."""
+        return self._present[:self._size, :len(self.metrics)]
+
+    @property
+    def task_codes(self) -> np.ndarray:
+        """int32 codes into task_types."""
+        return self._task_codes[:self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """float64 timestamps."""
+        return self._timestamps[:self._size]
+
+    def outcome_matrix(self, metrics: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Outcome values and presence mask for the given metrics, in that order.
+
+        Metrics never recorded come back as an all-absent column.
+        """
+        values = np.full((self._size, len(metrics)), np.nan)
+        mask = np.zeros((self._size, len(metrics)), dtype=bool)
+        for j, metric in enumerate(metrics):
+            column = self._metric_index.get(metric)
+            if column is not None:
+                values[:, j] = self._outcomes[:self._size, column]
+                mask[:, j] = self._present[:self._size, column]
+        return values, mask
+
+    def outcome_column(self, metric: str, default: float = 0.0) -> np.ndarray:
+        """One metric as a 1-D array, with `default` where it was not recorded."""
+        values, mask = self.outcome_matrix([metric])
+        return np.where(mask[:, 0], values[:, 0], default)
+
+    def distinct_configs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Group rows by identical config vectors.
+
+        Equivalent to np.unique(config, axis=0) but much faster on large
+        frames: each column is coded separately and the codes are packed
+        into one int64 key per row.
+
+        Returns:
+            (first_rows, inverse): the first row index of each distinct
+            config, and each row's position in first_rows
+        """
+        config = self.config
+        keys = np.zeros(self._size, dtype=np.int64)
+        radix = 1
+        for j in range(self.config_width):
+            _, codes = np.unique(config[:, j], return_inverse=True)
+            cardinality = int(codes.max()) + 1 if self._size else 1
+            if radix * cardinality >= 2 ** 62:
+                # Re-densify before the packed key could overflow
+                _, keys = np.unique(keys, return_inverse=True)
+                keys = keys.astype(np.int64)
+                radix = int(keys.max()) + 1
+            keys = keys * cardinality + codes.reshape(-1)
+            radix *= cardinality
+
+        _, first_rows, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        return first_rows, inverse.reshape(-1)
+
+    def select(
+        self,
+        since: Optional[float] = None,
+        task_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """Row indices matching the filters, in insertion order."""
+        keep = np.ones(self._size, dtype=bool)
+        if since is not None:
+            keep &= self.timestamps >= since
+        if task_type is not None:
+            code = self._task_index.get(task_type)
+            if code is None:
+                return np.zeros(0, dtype=np.intp)
+            keep &= self.task_codes == code
+        return np.flatnonzero(keep)
+
+
+def group_means(
+    codes: np.ndarray,
+    n_groups: int,
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-group column means.
+
+    Args:
+        codes: Group code per row (0 <= code < n_groups)
+        n_groups: Number of groups
+        values: (n x m) values; absent entries should already be filled
+
+    Returns:
+        (means (n_groups x m), counts (n_groups,)); empty groups have NaN means
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(len(codes), -1)
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.empty((n_groups, values.shape[1]))
+    for j in range(values.shape[1]):
+        sums[:, j] = np.bincount(codes, weights=values[:, j], minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts[:, None]
+    return means, counts
+
+
+def masked_correlation(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_mask: Optional[np.ndarray] = None,
+    y_mask: Optional[np.ndarray] = None,
+    min_samples: int = 10,
+) -> np.ndarray:
+    """
+    Pearson correlation of every x column against every y column.
+
+    Each (i, j) pair uses only rows where both x[:, i] and y[:, j] are
+    present, computed for all pairs at once with masked matrix products.
+    Pairs with fewer than min_samples rows, or with no variance on either
+    side, get 0.0.
+
+    Args:
+        x: (n x p) matrix
+        y: (n x q) matrix
+        x_mask: Presence mask for x (default: not NaN)
+        y_mask: Presence mask for y (default: not NaN)
+        min_samples: Minimum paired rows for a correlation
+
+    Returns:
+        (p x q) correlation matrix
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_mask = ~np.isnan(x) if x_mask is None else x_mask & ~np.isnan(x)
+    y_mask = ~np.isnan(y) if y_mask is None else y_mask & ~np.isnan(y)
+    wx = x_mask.astype(np.float64)
+    wy = y_mask.astype(np.float64)
+
+    # Center on per-column means first so the one-pass moment formulas
+    # below do not lose precision to large offsets
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x0 = np.where(x_mask, x - np.nan_to_num(np.sum(np.where(x_mask, x, 0.0), 0) / wx.sum(0)), 0.0)
+        y0 = np.where(y_mask, y - np.nan_to_num(np.sum(np.where(y_mask, y, 0.0), 0) / wy.sum(0)), 0.0)
+
+    n = wx.T @ wy
+    sx = x0.T @ wy
+    sy = wx.T @ y0
+    sxx = (x0 * x0).T @ wy
+    syy = wx.T @ (y0 * y0)
+    sxy = x0.T @ y0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = cov / np.sqrt(var_x * var_y)
+
+    # Variances that are zero up to rounding count as constant columns
+    eps = 1e-10
+    x_scale = np.max(np.abs(np.where(x_mask, x, 0.0)), axis=0, initial=0.0) ** 2
+    y_scale = np.max(np.abs(np.where(y_mask, y, 0.0)), axis=0, initial=0.0) ** 2
+    valid = (
+        (n >= min_samples)
+        & (var_x > eps * n * x_scale[:, None])
+        & (var_y > eps * n * y_scale[None, :])
+    )
+    return np.where(valid, np.clip(r, -1.0, 1.0), 0.0)
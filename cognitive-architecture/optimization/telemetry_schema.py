@@ -210,42 +210,109 @@ class TelemetryStore:
     """
     Persistent storage for telemetry data.
 
-    Uses file-based storage with memory-mcp compatible structure.
+    Records are appended as compact JSON lines to one segment per UTC day:
+
+        <base_path>/segments/2026-01-15.jsonl
+        <base_path>/segments/index.json   # per-segment min/max timestamp
+
+    Date-range loads consult the index and open only overlapping segments.
+    The index is advisory: any segment whose size differs from its index
+    entry (e.g. appended by another process) is rescanned on load.
+
+    Older stores wrote one pretty-printed file per record
+    (telemetry_executions_<date>_<task_id>.json); those are still read
+    until migrate_legacy() folds them into segments.
     """
 
+    SEGMENT_DIR = "segments"
+    INDEX_FILE = "index.json"
+    LEGACY_PATTERN = "telemetry_executions_*.json"
+
     def __init__(self, base_path: Optional[str] = None):
         """Initialize store with base path."""
         if base_path is None:
             base_path = os.path.expanduser("~/.claude/memory-mcp-data/telemetry")
         self.base_path = Path(base_path)
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.segment_path = self.base_path / self.SEGMENT_DIR
+        self.segment_path.mkdir(parents=True, exist_ok=True)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._has_legacy: Optional[bool] = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
 
     def store(self, record: ExecutionTelemetry) -> str:
         """Store a telemetry record, return the key."""
-        key = record.memory_key()
-        file_path = self.base_path / f"{key.replace('/', '_')}.json"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return self.store_many([record])[0]
 
-        with open(file_path, 'w') as f:
-            json.dump(record.to_dict(), f, indent=2)
+    def store_many(self, records: List[ExecutionTelemetry]) -> List[str]:
+        """
+        Append many records, opening each day's segment once.
 
-        return key
+        Returns:
+            Memory keys of the stored records, in input order
+        """
+        by_date: Dict[str, List[ExecutionTelemetry]] = {}
+        for record in records:
+            by_date.setdefault(record.timestamp[:10], []).append(record)
+
+        index = self._load_index()
+        for date, group in by_date.items():
+            segment = self._segment_file(date)
+            lines = "".join(
+                json.dumps(r.to_dict(), separators=(",", ":")) + "\n" for r in group
+            )
+            with open(segment, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+            entry = index.get(date)
+            size = segment.stat().st_size
+            previous_size = entry["size"] if entry is not None else 0
+            if previous_size + len(lines.encode("utf-8")) != size:
+                # Another writer appended since we last looked
+                entry = self._scan_segment(segment)
+            else:
+                timestamps = [r.timestamp for r in group]
+                if entry is not None:
+                    timestamps += [entry["min"], entry["max"]]
+                entry = {
+                    "min": min(timestamps),
+                    "max": max(timestamps),
+                    "count": len(group) + (entry["count"] if entry else 0),
+                    "size": size,
+                }
+            index[date] = entry
+
+        if by_date:
+            self._save_index(index)
+        return [record.memory_key() for record in records]
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
 
     def load_range(self, start_date: str, end_date: str) -> TelemetryBatch:
-        """Load all records in a date range."""
+        """Load all records in a date range (inclusive, YYYY-MM-DD)."""
         batch = TelemetryBatch()
 
-        for file_path in self.base_path.glob("telemetry_executions_*.json"):
-            try:
-                with open(file_path) as f:
-                    data = json.load(f)
-                    record = ExecutionTelemetry.from_dict(data)
-
-                    # Filter by date
-                    if start_date <= record.timestamp[:10] <= end_date:
-                        batch.add(record)
-            except Exception:
+        for date, entry in sorted(self._refresh_index().items()):
+            if entry["count"] == 0:
+                continue
+            if entry["max"][:10] < start_date or entry["min"][:10] > end_date:
+                continue
+            for record in self._read_segment(self._segment_file(date)):
+                if start_date <= record.timestamp[:10] <= end_date:
+                    batch.add(record)
+
+        for file_path in self.legacy_files():
+            # Legacy names embed the date, so skip out-of-range files unread
+            date = file_path.name[len("telemetry_executions_"):][:10]
+            if not (start_date <= date <= end_date):
                 continue
+            record = self._read_legacy(file_path)
+            if record is not None and start_date <= record.timestamp[:10] <= end_date:
+                batch.add(record)
 
         return batch
 
@@ -261,6 +328,150 @@ class TelemetryStore:
             end.strftime("%Y-%m-%d")
         )
 
+    def segment_index(self) -> Dict[str, Dict[str, Any]]:
+        """Return the per-segment index: date -> {min, max, count, size}."""
+        return {date: dict(entry) for date, entry in self._refresh_index().items()}
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def legacy_files(self) -> List[Path]:
+        """Per-record files from the pre-segment layout, if any remain."""
+        if self._has_legacy is False:
+            return []
+        files = list(self.base_path.glob(self.LEGACY_PATTERN))
+        self._has_legacy = bool(files)
+        return files
+
+    def migrate_legacy(self, keep_legacy: bool = False, batch_size: int = 1000) -> int:
+        """
+        Fold per-record legacy JSON files into daily segments.
+
+        Args:
+            keep_legacy: Move migrated files into <base_path>/legacy/
+                instead of deleting them (they are no longer loaded either way)
+            batch_size: Records appended per store_many() call
+
+        Returns:
+            Number of records migrated (unreadable files are left in place)
+        """
+        migrated = 0
+        pending: List[ExecutionTelemetry] = []
+        pending_files: List[Path] = []
+
+        def flush() -> None:
+            nonlocal migrated
+            if not pending:
+                return
+            self.store_many(pending)
+            migrated += len(pending)
+            for path in pending_files:
+                if keep_legacy:
+                    path.rename(archive / path.name)
+                else:
+                    path.unlink()
+            pending.clear()
+            pending_files.clear()
+
+        archive = self.base_path / "legacy"
+        if keep_legacy:
+            archive.mkdir(exist_ok=True)
+
+        for file_path in sorted(self.legacy_files()):
+            record = self._read_legacy(file_path)
+            if record is None:
+                continue
+            pending.append(record)
+            pending_files.append(file_path)
+            if len(pending) >= batch_size:
+                flush()
+        flush()
+
+        self._has_legacy = None
+        return migrated
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _segment_file(self, date: str) -> Path:
+        return self.segment_path / f"{date}.jsonl"
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index from disk once per store instance."""
+        if self._index is None:
+            try:
+                with open(self.segment_path / self.INDEX_FILE, encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Write the index atomically so readers never see a partial file."""
+        path = self.segment_path / self.INDEX_FILE
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def _refresh_index(self) -> Dict[str, Dict[str, Any]]:
+        """Reconcile the index with the segments actually on disk."""
+        index = self._load_index()
+        on_disk = {}
+        for entry in os.scandir(self.segment_path):
+            if entry.name.endswith(".jsonl"):
+                on_disk[entry.name[:-len(".jsonl")]] = entry.stat().st_size
+
+        changed = False
+        for date in list(index):
+            if date not in on_disk:
+                del index[date]
+                changed = True
+        for date, size in on_disk.items():
+            if date not in index or index[date]["size"] != size:
+                index[date] = self._scan_segment(self._segment_file(date))
+                changed = True
+
+        if changed:
+            self._save_index(index)
+        return index
+
+    def _scan_segment(self, segment: Path) -> Dict[str, Any]:
+        """Build an index entry by reading a segment's timestamps."""
+        timestamps = [record.timestamp for record in self._read_segment(segment)]
+        return {
+            "min": min(timestamps) if timestamps else "",
+            "max": max(timestamps) if timestamps else "",
+            "count": len(timestamps),
+            "size": segment.stat().st_size,
+        }
+
+    def _read_segment(self, segment: Path) -> List[ExecutionTelemetry]:
+        """Parse a segment, skipping blank or torn lines."""
+        records = []
+        try:
+            with open(segment, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(ExecutionTelemetry.from_dict(json.loads(line)))
+                    except Exception:
+                        continue
+        except OSError:
+            pass
+        return records
+
+    @staticmethod
+    def _read_legacy(file_path: Path) -> Optional[ExecutionTelemetry]:
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                return ExecutionTelemetry.from_dict(json.load(f))
+        except Exception:
+            return None
+
 
 # Convenience functions for hook integration
 def create_telemetry_record(
@@ -52,6 +52,7 @@ from pymoo.core.evaluator import Evaluator
 # Local imports
 from core.config import FullConfig, VectorCodec, FrameworkConfig, PromptConfig, VerixStrictness
 from optimization.globalmoo_client import GlobalMOOClient, OptimizationOutcome, ParetoPoint
+from optimization.population_evaluator import PopulationEvaluator, VectorizedEvaluator
 
 # Telemetry integration for real data
 try:
@@ -391,14 +392,102 @@ def evaluate_config_14dim(x: np.ndarray) -> np.ndarray:
     ])
 
 
+def evaluate_population_5dim(X: np.ndarray) -> np.ndarray:
+    """
+    Vectorized evaluate_config_5dim over a population.
+
+    Args:
+        X: (n x 5) population
+
+    Returns:
+        (n x 4) objectives, row-for-row identical to evaluate_config_5dim
+    """
+    X = np.atleast_2d(X)
+    evidential = X[:, 0]
+    aspectual = X[:, 1]
+    strictness = X[:, 2]
+    compression = X[:, 3]
+    require_ground = X[:, 4]
+
+    frame_count = evidential + aspectual + 0.5
+
+    task_accuracy = BASE_ACCURACY + (frame_count * FRAME_ACCURACY_COEFFICIENT) + (strictness * STRICTNESS_ACCURACY_COEFFICIENT)
+    task_accuracy = np.minimum(0.98, task_accuracy)
+
+    token_efficiency = BASE_EFFICIENCY - (frame_count * FRAME_EFFICIENCY_COST) - (strictness * STRICTNESS_EFFICIENCY_COST) + (compression * COMPRESSION_EFFICIENCY_GAIN)
+    token_efficiency = np.maximum(0.3, np.minimum(0.95, token_efficiency))
+
+    edge_robustness = BASE_ROBUSTNESS + (evidential * EVIDENTIAL_ROBUSTNESS_GAIN) + (require_ground * GROUND_ROBUSTNESS_GAIN) + (strictness * 0.05)
+    edge_robustness = np.minimum(0.95, edge_robustness)
+
+    epistemic_consistency = BASE_CONSISTENCY + (strictness * STRICTNESS_CONSISTENCY_GAIN) + (require_ground * CONFIDENCE_CONSISTENCY_GAIN) + (evidential * 0.1)
+    epistemic_consistency = np.minimum(0.95, epistemic_consistency)
+
+    return -np.column_stack([
+        task_accuracy,
+        token_efficiency,
+        edge_robustness,
+        epistemic_consistency,
+    ])
+
+
+def evaluate_population_14dim(X: np.ndarray) -> np.ndarray:
+    """
+    Vectorized evaluate_config_14dim over a population.
+
+    Args:
+        X: (n x 14) population
+
+    Returns:
+        (n x 4) objectives, row-for-row identical to evaluate_config_14dim
+    """
+    X = np.atleast_2d(X)
+    evidential, aspectual, morphological, compositional = X[:, 0], X[:, 1], X[:, 2], X[:, 3]
+    honorific, classifier, spatial = X[:, 4], X[:, 5], X[:, 6]
+    strictness, compression = X[:, 7], X[:, 8]
+    require_ground, require_confidence = X[:, 9], X[:, 10]
+    temperature, coherence_weight, evidence_weight = X[:, 11], X[:, 12], X[:, 13]
+
+    frame_count = evidential + aspectual + morphological + compositional + honorific + classifier + spatial
+
+    task_accuracy = 0.6 + (frame_count * 0.035) + (strictness * 0.06) + (evidence_weight * 0.08)
+    task_accuracy = task_accuracy + ((classifier * 0.03) + (evidential * 0.02))
+    task_accuracy = np.minimum(0.98, task_accuracy)
+
+    token_efficiency = 0.95 - (frame_count * 0.055) - (strictness * 0.03) + (compression * 0.06)
+    token_efficiency = token_efficiency - ((morphological * 0.02) - (temperature * 0.02))
+    token_efficiency = np.maximum(0.25, np.minimum(0.95, token_efficiency))
+
+    edge_robustness = 0.45 + (evidential * 0.15) + (require_ground * 0.18) + (spatial * 0.08)
+    edge_robustness = edge_robustness + ((strictness * 0.04) + (coherence_weight * 0.05))
+    edge_robustness = np.minimum(0.95, edge_robustness)
+
+    epistemic_consistency = 0.35 + (strictness * 0.18) + (require_confidence * 0.15)
+    epistemic_consistency = epistemic_consistency + ((require_ground * 0.1) + (evidence_weight * 0.12) + (evidential * 0.05))
+    epistemic_consistency = np.minimum(0.95, epistemic_consistency)
+
+    return -np.column_stack([
+        task_accuracy,
+        token_efficiency,
+        edge_robustness,
+        epistemic_consistency,
+    ])
+
+
 # =============================================================================
 # PYMOO PROBLEM DEFINITIONS
 # =============================================================================
 
 class CognitiveProblem5D(Problem):
-    """5-dimensional cognitive architecture optimization problem."""
+    """
+    5-dimensional cognitive architecture optimization problem.
 
-    def __init__(self):
+    Populations are scored by a PopulationEvaluator backend; the default is
+    the vectorized analytic surrogate. Pass a ConfigCachedEvaluator built
+    with CognitiveProblem5D.decode to score through the real runtime.
+    """
+
+    def __init__(self, evaluator: Optional[PopulationEvaluator] = None):
         super().__init__(
             n_var=5,
             n_obj=4,
@@ -406,17 +495,26 @@ class CognitiveProblem5D(Problem):
             xl=np.array([0, 0, 0, 0, 0]),      # lower bounds
             xu=np.array([1, 1, 2, 2, 1]),      # upper bounds
         )
+        self.evaluator = evaluator or VectorizedEvaluator(evaluate_population_5dim)
+
+    @staticmethod
+    def decode(x: np.ndarray) -> FullConfig:
+        """Decode a 5-dim row to the FullConfig it represents."""
+        return VectorCodec.decode(expand_5d_to_14d(x).tolist())
 
     def _evaluate(self, X, out, *args, **kwargs):
         """Evaluate population."""
-        F = np.array([evaluate_config_5dim(x) for x in X])
-        out["F"] = F
+        out["F"] = self.evaluator(X)
 
 
 class CognitiveProblem14D(Problem):
-    """Full 14-dimensional cognitive architecture optimization problem."""
+    """
+    Full 14-dimensional cognitive architecture optimization problem.
+
+    See CognitiveProblem5D for evaluator backends.
+    """
 
-    def __init__(self):
+    def __init__(self, evaluator: Optional[PopulationEvaluator] = None):
         super().__init__(
             n_var=14,
             n_obj=4,
@@ -424,11 +522,16 @@ class CognitiveProblem14D(Problem):
             xl=np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
             xu=np.array([1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1]),
         )
+        self.evaluator = evaluator or VectorizedEvaluator(evaluate_population_14dim)
+
+    @staticmethod
+    def decode(x: np.ndarray) -> FullConfig:
+        """Decode a 14-dim row to the FullConfig it represents."""
+        return VectorCodec.decode([float(v) for v in x])
 
     def _evaluate(self, X, out, *args, **kwargs):
         """Evaluate population."""
-        F = np.array([evaluate_config_14dim(x) for x in X])
-        out["F"] = F
+        out["F"] = self.evaluator(X)
 
 
 # Alias for spec compatibility - use 14D as the main problem
@@ -443,12 +546,16 @@ def run_globalmoo_stage(
     client: GlobalMOOClient,
     model_id: int = 2193,
     project_id: int = 8318,
+    evaluator: Optional[PopulationEvaluator] = None,
 ) -> List[Dict[str, Any]]:
     """
     Stage 1: Use GlobalMOO's 151 auto-generated cases + local NSGA-II.
 
     Since GlobalMOO trial/inverse endpoints need higher subscription,
     we use the auto-generated input cases and run local optimization.
+
+    Pass an evaluator (e.g. ConfigCachedEvaluator) to score populations
+    with something other than the analytic surrogate.
     """
     print("\n" + "=" * 70)
     print("STAGE 1: GlobalMOO Exploration (5-dimensional)")
@@ -477,7 +584,7 @@ def run_globalmoo_stage(
     # Run PyMOO NSGA-II on 5D space
     print("\nRunning NSGA-II on 5-dimensional space...")
 
-    problem = CognitiveProblem5D()
+    problem = CognitiveProblem5D(evaluator=evaluator)
 
     # Prepare initial population from GlobalMOO cases
     initial_X = None
@@ -605,11 +712,13 @@ def run_pymoo_refinement_stage(
     stage1_results: List[Dict[str, Any]],
     n_generations: int = 100,
     pop_size: int = 200,
+    evaluator: Optional[PopulationEvaluator] = None,
 ) -> List[Dict[str, Any]]:
     """
     Stage 2: PyMOO NSGA-II refinement on full 14-dimensional space.
 
     Seeds initial population from Stage 1 Pareto solutions expanded to 14D.
+    The optional evaluator replaces the analytic surrogate (see Stage 1).
     """
     print("\n" + "=" * 70)
     print("STAGE 2: PyMOO NSGA-II Refinement (14-dimensional)")
@@ -647,7 +756,7 @@ def run_pymoo_refinement_stage(
     # Run NSGA-II on 14D space
     print(f"\nRunning NSGA-II for {n_generations} generations...")
 
-    problem = CognitiveProblem14D()
+    problem = CognitiveProblem14D(evaluator=evaluator)
 
     algorithm = NSGA2(
         pop_size=pop_size,
@@ -658,7 +767,7 @@ def run_pymoo_refinement_stage(
     )
 
     # Seed with expanded Stage 1 solutions
-    seed_F = np.array([evaluate_config_14dim(x) for x in seed_X])
+    seed_F = problem.evaluator(seed_X)
 
     result = minimize(
         problem,
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+VERIX Parser Benchmark
+
+Compares throughput of the streaming VerixTokenizer (VerixParser.parse)
+against the reference regex parser (VerixParser.parse_regex) on a
+synthetic agent transcript, and checks that both produce the same claims.
+
+Usage:
+    python scripts/bench_verix_parser.py [--lines 5000] [--repeat 5] [--chunk 64]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.verix import VerixParser
+
+
+PROSE = [
+    "Let me look at the failing test before changing anything.",
+    "The config loader reads `settings.yaml` and falls back to defaults [see docs].",
+    "- Step 3: run the migration, then re-check the [schema] table.",
+    "```python\nresult = items[index] if index < len(items) else None\n```",
+    "    return {key: value for key, value in pairs if value}",
+    "",
+]
+
+CLAIMS = [
+    "[assert|neutral] The cache is invalidated on write [ground:src/cache.py:42] [conf:0.85] [state:confirmed]",
+    "[agent:model] [id:c-{n}] [assert|positive] Latency dropped after the change [ground:c-{m}] [conf:0.72]",
+    "[meta] [query|uncertain] Is claim c-{m} still valid given the new data [conf:0.40] [state:provisional]",
+    "[direct|neutral] Re-run the benchmark with a warm cache [state:provisional]",
+    "[agent:process] [assert|negative] Test suite reports {n} failures [ground:pytest output] [conf:0.99] [state:confirmed]",
+]
+
+
+def build_transcript(lines: int, claim_ratio: float, seed: int = 0) -> str:
+    """Build a synthetic transcript with a mix of prose and L1 claims."""
+    rng = random.Random(seed)
+    out = []
+    for n in range(lines):
+        if rng.random() < claim_ratio:
+            template = rng.choice(CLAIMS)
+            out.append(template.format(n=n, m=max(0, n - rng.randint(1, 20))))
+        else:
+            out.append(rng.choice(PROSE))
+    return "\n".join(out)
+
+
+def time_call(fn, repeat: int) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def stream_parse(parser: VerixParser, text: str, chunk: int):
+    """Parse text delivered in fixed-size chunks."""
+    tokenizer = parser.stream()
+    claims = []
+    for i in range(0, len(text), chunk):
+        claims.extend(tokenizer.feed(text[i:i + chunk]))
+    claims.extend(tokenizer.close())
+    return claims
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VERIX parsing")
+    parser.add_argument("--lines", type=int, default=5000, help="Transcript length in lines")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best of N)")
+    parser.add_argument("--chunk", type=int, default=64, help="Chunk size for streaming mode")
+    args = parser.parse_args()
+
+    verix = VerixParser()
+
+    print("=" * 70)
+    print("VERIX PARSER BENCHMARK")
+    print("=" * 70)
+
+    for ratio in (0.05, 0.3, 0.9):
+        text = build_transcript(args.lines, ratio)
+        mb = len(text) / 1e6
+
+        expected = verix.parse_regex(text)
+        assert verix.parse(text) == expected, "tokenizer output differs from regex parser"
+        assert stream_parse(verix, text, args.chunk) == expected, "streaming output differs"
+
+        regex_s = time_call(lambda: verix.parse_regex(text), args.repeat)
+        token_s = time_call(lambda: verix.parse(text), args.repeat)
+        stream_s = time_call(lambda: stream_parse(verix, text, args.chunk), args.repeat)
+
+        print(f"\nclaim ratio {ratio:.2f}: {args.lines} lines, {mb:.2f} MB, {len(expected)} claims")
+        print(f"  regex     {regex_s * 1000:8.1f} ms  {mb / regex_s:6.1f} MB/s")
+        print(f"  tokenizer {token_s * 1000:8.1f} ms  {mb / token_s:6.1f} MB/s  "
+              f"({regex_s / token_s:.2f}x)")
+        print(f"  streaming {stream_s * 1000:8.1f} ms  {mb / stream_s:6.1f} MB/s  "
+              f"(chunk={args.chunk})")
+
+
+if __name__ == "__main__":
+    main()
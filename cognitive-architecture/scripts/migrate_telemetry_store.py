@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Telemetry Store Migration
+
+Folds the legacy one-file-per-record telemetry layout
+(telemetry_executions_<date>_<task_id>.json) into the daily JSONL
+segments used by TelemetryStore, and rebuilds the segment index.
+
+Usage:
+    python scripts/migrate_telemetry_store.py [--path DIR] [--keep-legacy] [--dry-run]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimization.telemetry_schema import TelemetryStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate telemetry to segmented storage")
+    parser.add_argument("--path", default=None,
+                        help="Telemetry directory (default: ~/.claude/memory-mcp-data/telemetry)")
+    parser.add_argument("--keep-legacy", action="store_true",
+                        help="Move migrated files to <path>/legacy/ instead of deleting them")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Records appended per write")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only count legacy files")
+    args = parser.parse_args()
+
+    store = TelemetryStore(base_path=args.path)
+
+    print("=" * 70)
+    print("TELEMETRY STORE MIGRATION")
+    print("=" * 70)
+    print(f"Store: {store.base_path}")
+
+    legacy = store.legacy_files()
+    print(f"Legacy files: {len(legacy)}")
+    if args.dry_run or not legacy:
+        return
+
+    start = time.perf_counter()
+    migrated = store.migrate_legacy(
+        keep_legacy=args.keep_legacy,
+        batch_size=args.batch_size,
+    )
+    elapsed = time.perf_counter() - start
+
+    index = store.segment_index()
+    print(f"Migrated {migrated} records in {elapsed:.1f}s")
+    print(f"Skipped (unreadable): {len(legacy) - migrated}")
+    print(f"Segments: {len(index)} ({sum(e['count'] for e in index.values())} records)")
+
+
+if __name__ == "__main__":
+    main()
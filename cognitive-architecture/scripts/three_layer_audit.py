@@ -155,23 +155,27 @@ class Layer1TelemetryAuditor(LayerAuditor):
     def _check_recent_data(self) -> None:
         telemetry_dir = Path.home() / ".claude" / "memory-mcp-data" / "telemetry" / "executions"
         if telemetry_dir.exists():
-            files = list(telemetry_dir.glob("*.json"))
-            recent_count = 0
-            cutoff = datetime.utcnow() - timedelta(days=7)
-
-            for f in files:
-                try:
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    if mtime > cutoff:
-                        recent_count += 1
-                except Exception:
-                    pass
+            try:
+                from optimization.telemetry_schema import TelemetryStore
+
+                store = TelemetryStore(base_path=str(telemetry_dir))
+                recent_count = len(store.load_last_n_days(7).records)
+                index = store.segment_index()
+                total = sum(entry["count"] for entry in index.values())
+                total += len(store.legacy_files())
+            except Exception as e:
+                self.add_result(AuditResult(
+                    "recent_data",
+                    False,
+                    f"Telemetry store unreadable: {e}",
+                ))
+                return
 
             self.add_result(AuditResult(
                 "recent_data",
                 recent_count > 0,
-                f"Found {recent_count} telemetry files from last 7 days",
-                {"total_files": len(files), "recent_files": recent_count}
+                f"Found {recent_count} telemetry records from last 7 days",
+                {"total_records": total, "recent_records": recent_count}
             ))
         else:
             self.add_result(AuditResult(
@@ -261,6 +261,34 @@ class TestTelemetryAggregator:
             aggregated = agg.aggregate_by_cluster()
             assert len(aggregated) > 0
 
+    def test_aggregate_by_frame_uses_first_point_metrics(self):
+        """aggregate_by_frame should average active points, missing metrics as 0."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=Path(tmpdir))
+            evidential = [1.0] + [0.0] * 13
+
+            agg.record_outcome(evidential, {"a": 0.8, "b": 0.4}, "default")
+            agg.record_outcome(evidential, {"a": 0.6}, "default")
+            agg.record_outcome([0.0] * 14, {"a": 0.1}, "default")
+
+            aggregated = agg.aggregate_by_frame()
+            assert list(aggregated) == ["evidential"]
+            assert aggregated["evidential"]["a"] == pytest.approx(0.7)
+            assert aggregated["evidential"]["b"] == pytest.approx(0.2)
+
+    def test_frame_tracks_recorded_points(self):
+        """The columnar frame should mirror get_points() row for row."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agg = TelemetryAggregator(storage_dir=Path(tmpdir))
+            agg.record_many([
+                TelemetryPoint([0.5] * 14, {"m": 0.1}, "a", 1.0),
+                TelemetryPoint([0.5] * 14, {"m": 0.2}, "b", 2.0),
+            ])
+
+            assert len(agg.frame) == len(agg.get_points()) == 2
+            assert agg.frame.outcome_column("m").tolist() == [0.1, 0.2]
+            assert [p.task_type for p in agg.get_points(since=2.0)] == ["b"]
+
     def test_save_and_load(self):
         """save and load should persist telemetry."""
         with tempfile.TemporaryDirectory() as tmpdir:
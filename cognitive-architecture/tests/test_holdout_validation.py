@@ -142,14 +142,16 @@ class TestThreeLayerAudit:
             for record in records:
                 store.store(record)
 
-            # Verify files created
-            files = list(Path(tmpdir).glob("*.json"))
-            assert len(files) == 3
+            # Verify records were appended to the day's segment
+            lines = []
+            for file in Path(tmpdir, "segments").glob("*.jsonl"):
+                with open(file) as f:
+                    lines.extend(line for line in f if line.strip())
+            assert len(lines) == 3
 
             # Verify data roundtrips correctly
-            for file in files:
-                with open(file) as f:
-                    data = json.load(f)
+            for line in lines:
+                data = json.loads(line)
                 assert "task_id" in data
                 assert "task_type" in data
 
@@ -0,0 +1,46 @@
+"""
+Tests for core/keyword_automaton.py
+
+Tests:
+- Overlapping and nested keyword matches
+- Agreement with naive substring search
+- Per-pattern occurrence counts
+"""
+
+import random
+
+from core.keyword_automaton import KeywordAutomaton
+
+
+class TestKeywordAutomaton:
+    """Tests for KeywordAutomaton."""
+
+    def test_classic_overlapping_matches(self):
+        """Should report every overlapping occurrence."""
+        automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+        matches = {(start, automaton.patterns[i]) for start, i in automaton.iter_matches("ushers")}
+        assert matches == {(1, "she"), (2, "he"), (2, "hers")}
+
+    def test_duplicates_and_empty_patterns_ignored(self):
+        """Duplicate and empty patterns should compile to a single entry."""
+        automaton = KeywordAutomaton(["file", "", "FILE", "path"])
+        assert automaton.patterns == ["file", "path"]
+        assert automaton.index_of("Path") == 1
+
+    def test_matches_naive_substring_search(self):
+        """Counts should agree with str.count-style overlapping search."""
+        rng = random.Random(0)
+        patterns = ["ab", "abab", "b", "bab", "ba", "aaa"]
+        automaton = KeywordAutomaton(patterns)
+        for _ in range(200):
+            text = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 40)))
+            expected = [
+                sum(1 for i in range(len(text)) if text.startswith(p, i)) for p in patterns
+            ]
+            assert automaton.count(text) == expected
+
+    def test_no_patterns(self):
+        """An empty automaton should never match."""
+        automaton = KeywordAutomaton([])
+        assert automaton.find_all("anything") == []
+        assert len(automaton) == 0
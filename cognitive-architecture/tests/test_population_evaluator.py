@@ -0,0 +1,119 @@
+"""
+Tests for optimization/population_evaluator.py
+
+Tests:
+- Vectorized surrogate objectives match the per-row functions
+- Problem classes route populations through their evaluator backend
+- Config cache deduplicates within and across generations
+- Process-pool evaluation matches serial evaluation
+"""
+
+import numpy as np
+
+from optimization.population_evaluator import (
+    ConfigCachedEvaluator,
+    PoolEvaluator,
+    RuntimeObjective,
+    VectorizedEvaluator,
+)
+from optimization.two_stage_optimizer import (
+    CognitiveProblem5D,
+    CognitiveProblem14D,
+    evaluate_config_5dim,
+    evaluate_config_14dim,
+    evaluate_population_5dim,
+    evaluate_population_14dim,
+)
+
+UPPER_14D = np.array([1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1])
+
+
+def random_population(n, upper, seed=0):
+    return np.random.default_rng(seed).random((n, len(upper))) * upper
+
+
+class TestVectorizedSurrogates:
+    """Tests for the vectorized analytic objectives."""
+
+    def test_5dim_matches_per_row(self):
+        """evaluate_population_5dim should equal evaluate_config_5dim row by row."""
+        X = random_population(500, np.array([1, 1, 2, 2, 1]))
+        expected = np.array([evaluate_config_5dim(x) for x in X])
+        assert np.array_equal(evaluate_population_5dim(X), expected)
+
+    def test_14dim_matches_per_row(self):
+        """evaluate_population_14dim should equal evaluate_config_14dim row by row."""
+        X = np.vstack([random_population(500, UPPER_14D), np.zeros(14), UPPER_14D])
+        expected = np.array([evaluate_config_14dim(x) for x in X])
+        assert np.array_equal(evaluate_population_14dim(X), expected)
+
+    def test_problem_uses_evaluator(self):
+        """Problem.evaluate should return the backend's objective matrix."""
+        X = random_population(20, UPPER_14D)
+        F = CognitiveProblem14D().evaluate(X, return_as_dictionary=True)["F"]
+        assert np.array_equal(F, evaluate_population_14dim(X))
+
+
+class TestConfigCachedEvaluator:
+    """Tests for ConfigCachedEvaluator."""
+
+    def test_distinct_configs_evaluated_once(self):
+        """Vectors decoding to the same FullConfig should share one evaluation."""
+        calls = []
+
+        def config_fn(config):
+            calls.append(config)
+            return [-float(config.prompt.verix_strictness.value)] * 4
+
+        evaluator = ConfigCachedEvaluator(config_fn, CognitiveProblem14D.decode)
+        X = np.zeros((4, 14))
+        X[1, 0] = 0.2     # still below the 0.5 frame threshold
+        X[2, 7] = 1.9     # rounds to strictness 2
+        X[3, 7] = 2.0
+
+        F = evaluator(X)
+
+        assert len(calls) == 2
+        assert F[:, 0].tolist() == [0.0, 0.0, -2.0, -2.0]
+        assert evaluator.stats()["hits"] == 2
+
+    def test_cache_persists_across_generations(self):
+        """A later population should reuse configs cached from earlier ones."""
+        calls = []
+
+        def config_fn(config):
+            calls.append(config)
+            return [0.0] * 4
+
+        problem = CognitiveProblem5D(
+            evaluator=ConfigCachedEvaluator(config_fn, CognitiveProblem5D.decode)
+        )
+        X = random_population(50, np.array([1, 1, 2, 2, 1]), seed=1)
+        problem.evaluate(X)
+        first = len(calls)
+        problem.evaluate(random_population(50, np.array([1, 1, 2, 2, 1]), seed=1))
+
+        assert len(calls) == first
+        assert problem.evaluator.stats()["misses"] == first
+
+
+class TestProcessPool:
+    """Tests for process-pool evaluation."""
+
+    def test_pool_matches_serial(self):
+        """PoolEvaluator should return rows in input order."""
+        X = random_population(40, UPPER_14D, seed=2)
+        with PoolEvaluator(evaluate_config_14dim, max_workers=2) as evaluator:
+            F = evaluator(X)
+        assert np.array_equal(F, evaluate_population_14dim(X))
+
+    def test_cached_runtime_objective_in_pool(self):
+        """Cache misses fanned out to workers should match serial evaluation."""
+        tasks = [{"task": "Explain caching", "task_type": "explanation"}]
+        X = random_population(12, UPPER_14D, seed=3)
+
+        serial = ConfigCachedEvaluator(RuntimeObjective(tasks), CognitiveProblem14D.decode)
+        with ConfigCachedEvaluator(
+            RuntimeObjective(tasks), CognitiveProblem14D.decode, max_workers=2
+        ) as pooled:
+            assert np.array_equal(pooled(X), serial(X))
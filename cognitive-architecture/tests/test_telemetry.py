@@ -131,9 +131,76 @@ class TestTelemetryStore:
             key = store.store(record)
             assert key is not None
 
-            # Verify file was created
-            files = list(store.base_path.glob("*.json"))
+            # Verify the record landed in its day's segment
+            files = list(store.segment_path.glob("*.jsonl"))
             assert len(files) == 1
+            assert files[0].name == f"{record.timestamp[:10]}.jsonl"
+
+    def test_store_many_groups_by_day(self):
+        """store_many() should append to one segment per day and index it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            records = [
+                ExecutionTelemetry(timestamp="2026-01-01T10:00:00"),
+                ExecutionTelemetry(timestamp="2026-01-02T09:00:00"),
+                ExecutionTelemetry(timestamp="2026-01-01T08:00:00"),
+            ]
+
+            keys = store.store_many(records)
+
+            assert keys == [r.memory_key() for r in records]
+            index = store.segment_index()
+            assert sorted(index) == ["2026-01-01", "2026-01-02"]
+            assert index["2026-01-01"]["count"] == 2
+            assert index["2026-01-01"]["min"] == "2026-01-01T08:00:00"
+            assert index["2026-01-01"]["max"] == "2026-01-01T10:00:00"
+
+    def test_load_range_reads_only_matching_days(self):
+        """load_range() should return only records inside the date range."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            for day in range(1, 6):
+                store.store(ExecutionTelemetry(
+                    task_id=f"t{day}", timestamp=f"2026-01-0{day}T12:00:00",
+                ))
+
+            batch = store.load_range("2026-01-02", "2026-01-04")
+
+            assert sorted(r.task_id for r in batch.records) == ["t2", "t3", "t4"]
+
+    def test_index_tracks_other_writers(self):
+        """Appends from another store instance should be picked up on load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reader = TelemetryStore(base_path=tmpdir)
+            reader.store(ExecutionTelemetry(task_id="a", timestamp="2026-01-01T00:00:00"))
+            assert len(reader.load_range("2026-01-01", "2026-01-01").records) == 1
+
+            writer = TelemetryStore(base_path=tmpdir)
+            writer.store(ExecutionTelemetry(task_id="b", timestamp="2026-01-01T01:00:00"))
+
+            batch = reader.load_range("2026-01-01", "2026-01-01")
+            assert sorted(r.task_id for r in batch.records) == ["a", "b"]
+            assert reader.segment_index()["2026-01-01"]["count"] == 2
+
+    def test_migrate_legacy_files(self):
+        """migrate_legacy() should fold per-record files into segments."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = TelemetryStore(base_path=tmpdir)
+            for day in (1, 2):
+                record = ExecutionTelemetry(
+                    task_id=f"old{day}", timestamp=f"2026-01-0{day}T12:00:00",
+                )
+                name = record.memory_key().replace("/", "_")
+                with open(os.path.join(tmpdir, f"{name}.json"), "w") as f:
+                    json.dump(record.to_dict(), f, indent=2)
+
+            # Legacy files are still readable before migration
+            assert len(store.load_range("2026-01-01", "2026-01-02").records) == 2
+
+            assert store.migrate_legacy() == 2
+            assert store.legacy_files() == []
+            batch = store.load_range("2026-01-01", "2026-01-02")
+            assert sorted(r.task_id for r in batch.records) == ["old1", "old2"]
 
 
 class TestTask:
@@ -208,8 +275,8 @@ class TestRealTaskEvaluator:
             evaluator.evaluate(config, task)
 
             # Check telemetry was stored
-            files = list(evaluator.telemetry_store.base_path.glob("*.json"))
-            assert len(files) == 1
+            index = evaluator.telemetry_store.segment_index()
+            assert sum(entry["count"] for entry in index.values()) == 1
 
     def test_to_objectives(self):
         """Should return objectives dict."""
@@ -0,0 +1,109 @@
+"""
+Tests for optimization/telemetry_frame.py
+
+Tests:
+- Columnar appends, growth, and metric discovery
+- Row selection and distinct-config grouping
+- Vectorized group means and masked correlation
+"""
+
+import numpy as np
+import pytest
+
+from optimization.telemetry_frame import TelemetryFrame, group_means, masked_correlation
+
+
+class TestTelemetryFrame:
+    """Tests for TelemetryFrame."""
+
+    def test_append_grows_past_initial_capacity(self):
+        """Appends beyond the initial capacity should keep every row."""
+        frame = TelemetryFrame(config_width=3)
+        n = TelemetryFrame.INITIAL_CAPACITY + 5
+        for i in range(n):
+            frame.append([i, 0.0, 1.0], {"m": float(i)}, "t", float(i))
+
+        assert len(frame) == n
+        assert frame.config.dtype == np.float32
+        assert frame.config[-1, 0] == n - 1
+        assert frame.outcome_column("m")[-1] == n - 1
+
+    def test_new_metrics_are_absent_for_earlier_rows(self):
+        """A metric first seen later should be masked out for earlier rows."""
+        frame = TelemetryFrame(config_width=2)
+        frame.append([0.0, 1.0], {"a": 1.0}, "t", 0.0)
+        frame.append([1.0, 1.0], {"a": 2.0, "b": 5.0}, "t", 1.0)
+
+        values, mask = frame.outcome_matrix(["a", "b", "never"])
+        assert mask.tolist() == [[True, False, False], [True, True, False]]
+        assert frame.outcome_column("b", default=-1.0).tolist() == [-1.0, 5.0]
+
+    def test_short_vectors_are_nan_padded(self):
+        """Short config vectors should be padded with NaN and keep their length."""
+        frame = TelemetryFrame(config_width=3)
+        frame.extend([([1.0], {}, "t", 0.0), ([1.0, 2.0, 3.0], {}, "t", 0.0)])
+
+        assert frame.config_lengths.tolist() == [1, 3]
+        assert np.isnan(frame.config[0, 1:]).all()
+
+    def test_select_filters(self):
+        """select() should filter by timestamp and task type."""
+        frame = TelemetryFrame(config_width=1)
+        for i, task in enumerate(["a", "b", "a", "b"]):
+            frame.append([0.0], {}, task, float(i))
+
+        assert frame.select(task_type="a").tolist() == [0, 2]
+        assert frame.select(since=2.0, task_type="b").tolist() == [3]
+        assert frame.select(task_type="missing").tolist() == []
+
+    def test_distinct_configs_matches_unique_rows(self):
+        """distinct_configs() should group rows like np.unique(axis=0)."""
+        rng = np.random.default_rng(0)
+        frame = TelemetryFrame(config_width=4)
+        frame.extend((list(row), {}, "t", 0.0) for row in rng.integers(0, 3, (200, 4)).astype(float))
+
+        first_rows, inverse = frame.distinct_configs()
+        _, expected_first, expected_inverse = np.unique(
+            frame.config, axis=0, return_index=True, return_inverse=True
+        )
+        assert sorted(first_rows.tolist()) == sorted(expected_first.tolist())
+        assert (frame.config[first_rows[inverse]] == frame.config).all()
+
+
+class TestKernels:
+    """Tests for the vectorized analysis kernels."""
+
+    def test_group_means(self):
+        """group_means() should average each column per group."""
+        codes = np.array([0, 1, 0, 2])
+        values = np.array([[1.0, 10.0], [2.0, 20.0], [3.0, 30.0], [4.0, 40.0]])
+        means, counts = group_means(codes, 4, values)
+
+        assert counts.tolist() == [2, 1, 1, 0]
+        assert means[0].tolist() == [2.0, 20.0]
+        assert np.isnan(means[3]).all()
+
+    def test_masked_correlation_matches_corrcoef(self):
+        """Each entry should equal np.corrcoef over the jointly present rows."""
+        rng = np.random.default_rng(1)
+        x = rng.random((300, 3))
+        y = np.column_stack([x[:, 0] * 2 + rng.random(300), rng.random(300)])
+        y[rng.random(300) < 0.3, 1] = np.nan
+
+        r = masked_correlation(x, y)
+
+        for i in range(3):
+            for j in range(2):
+                mask = ~np.isnan(y[:, j])
+                expected = np.corrcoef(x[mask, i], y[mask, j])[0, 1]
+                assert r[i, j] == pytest.approx(expected, abs=1e-12)
+
+    def test_masked_correlation_degenerate_pairs_are_zero(self):
+        """Constant columns and too-few samples should give 0.0."""
+        x = np.column_stack([np.full(20, 0.1), np.arange(20.0)])
+        y = np.arange(20.0).reshape(-1, 1)
+
+        r = masked_correlation(x, y)
+        assert r[0, 0] == 0.0
+        assert r[1, 0] == pytest.approx(1.0)
+        assert masked_correlation(x, y, min_samples=21)[1, 0] == 0.0
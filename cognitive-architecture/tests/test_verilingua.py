@@ -19,7 +19,10 @@ from core.verilingua import (
     ClassifierFrame,
     SpatialFrame,
     FrameRegistry,
+    ResponseFeatures,
+    TriggerHits,
     score_all_frames,
+    score_all_frames_batch,
     aggregate_frame_score,
     get_combined_activation_instruction,
 )
@@ -230,6 +233,57 @@ class TestFrameRegistry:
         assert "spatial" in names
 
 
+class TestFrameTriggers:
+    """Tests for the compiled keyword trigger automaton (FR1.3)."""
+
+    @pytest.fixture
+    def isolated_registry(self, monkeypatch):
+        """Let a test register frames without leaking into other tests."""
+        monkeypatch.setattr(FrameRegistry, "_frames", FrameRegistry.get_all())
+        monkeypatch.setattr(FrameRegistry, "KEYWORD_TRIGGERS", dict(FrameRegistry.KEYWORD_TRIGGERS))
+        monkeypatch.setattr(FrameRegistry, "_trigger_index", None)
+
+    def test_match_triggers_counts_and_positions(self):
+        """match_triggers() should report every occurrence with its position."""
+        hits = FrameRegistry.match_triggers("Check the file, then the other FILE.")
+        assert isinstance(hits["spatial"], TriggerHits)
+        assert hits["spatial"].count == 2
+        assert hits["spatial"].positions == [(10, "file"), (31, "file")]
+        assert hits["evidential"].count == 0
+
+    def test_match_triggers_reports_overlapping_keywords(self):
+        """Overlapping keywords should all be reported."""
+        hits = FrameRegistry.match_triggers("the task is in progress")
+        assert set(hits["aspectual"].keywords) == {"in progress", "progress"}
+
+    def test_scans_beyond_first_500_chars(self):
+        """Triggers late in a long prompt should still activate frames."""
+        prompt = ("x" * 2000) + " where is the directory"
+        config = FrameworkConfig(evidential=True, spatial=True)
+        names = [f.name for f in FrameRegistry.get_active_fast(prompt, config)]
+        assert "spatial" in names
+        assert FrameRegistry.score_triggers(prompt, max_chars=500)["spatial"] == 0
+
+    def test_get_active_fast_falls_back_to_evidential(self):
+        """No trigger hits should fall back to the evidential frame."""
+        config = FrameworkConfig(evidential=True)
+        active = FrameRegistry.get_active_fast("zzz qqq", config)
+        assert [f.name for f in active] == ["evidential"]
+
+    def test_score_triggers_counts_distinct_keywords(self):
+        """score_triggers() should count distinct triggers per frame."""
+        scores = FrameRegistry.score_triggers("file file path")
+        assert scores["spatial"] == 2
+
+    def test_register_invalidates_compiled_triggers(self, isolated_registry):
+        """register() with triggers should recompile the automaton."""
+        assert FrameRegistry.match_triggers("consult the oracle")["evidential"].count == 0
+
+        FrameRegistry.register(EvidentialFrame(name="oracle"), triggers=["oracle"])
+        hits = FrameRegistry.match_triggers("consult the oracle")
+        assert hits["oracle"].count == 1
+
+
 class TestScoringFunctions:
     """Tests for scoring utility functions."""
 
@@ -266,6 +320,58 @@ class TestScoringFunctions:
         assert score == 1.0
 
 
+class TestResponseFeatures:
+    """Tests for shared ResponseFeatures and batch scoring."""
+
+    RESPONSE = (
+        "[witnessed] The file is a parser. [audience:dev] It means 3 things! "
+        "Some HTTPServer refactoring is in progress [complete]?"
+    )
+
+    def test_marker_counts_are_case_insensitive(self):
+        """Bracket markers should be counted from one case-insensitive scan."""
+        features = ResponseFeatures("[Witnessed] a [witnessed] b [root:x]")
+        assert features.marker_count("[witnessed]") == 2
+        assert features.marker_count("[ROOT:") == 1
+        assert features.markers_present(["[witnessed]", "[root:", "[path:"]) == 2
+
+    def test_sentence_spans(self):
+        """Sentence spans should cover each sentence including its terminator."""
+        features = ResponseFeatures("One. Two?! three")
+        assert features.sentence_end_count == 2
+        assert features.sentence_spans == [(0, 4), (4, 10), (10, 16)]
+
+    def test_count_words_matches_whole_words_only(self):
+        """count_words() should match whole words case-insensitively."""
+        features = ResponseFeatures("File profile FILE files")
+        assert features.count_words(("file",)) == 2
+
+    def test_score_features_matches_score_response(self):
+        """Each frame should score features exactly like the raw response."""
+        features = ResponseFeatures(self.RESPONSE)
+        for frame in FrameRegistry.get_all().values():
+            assert frame.score_features(features) == frame.score_response(self.RESPONSE)
+
+    def test_score_all_frames_accepts_features(self):
+        """score_all_frames() should accept precomputed features."""
+        config = FrameworkConfig()
+        features = ResponseFeatures(self.RESPONSE)
+        assert score_all_frames(features, config) == score_all_frames(self.RESPONSE, config)
+
+    def test_batch_matrix_matches_single_scoring(self):
+        """score_all_frames_batch() rows should match per-response scores."""
+        config = FrameworkConfig(aspectual=True, spatial=True)
+        responses = [self.RESPONSE, "", "plain text without markers."]
+        matrix = score_all_frames_batch(responses, config)
+        names = [frame.name for frame in FrameRegistry.get_active(config)]
+
+        assert matrix.shape == (3, len(names))
+        for row, response in enumerate(responses):
+            expected = score_all_frames(response, config)
+            assert list(matrix[row]) == [expected[name] for name in names]
+            assert matrix[row].mean() == pytest.approx(aggregate_frame_score(response, config))
+
+
 class TestCombinedActivation:
     """Tests for combined activation instructions."""
 
@@ -174,6 +174,67 @@ class TestVerixParser:
             assert claims[0].state == State.PROVISIONAL
 
 
+TOKENIZER_CORPUS = [
+    "[assert|neutral] Test content [ground:source] [conf:0.85] [state:confirmed]",
+    "\n        [assert|neutral] First claim [conf:0.9]\n        [query|uncertain] Second claim [conf:0.5]\n        ",
+    "A.85:Test content\nMC+90:Model commits\nnot a claim\n?~5:maybe",
+    "[meta:verix] [agent:system] [id:c-1] [assert|neutral] VERIX works [ground:spec] [conf:0.8]",
+    "[meta] [agent:model] [assert|neutral] About c-1 [ground:c-1]\n\n\nTrailing prose",
+    "[agent:bogus] [assert|neutral] Invalid agent skipped\nA.50:L0 ignored when L1 present?",
+    "[foo|bar] invalid enums [conf:0.5]\nA.50:L0 used since no valid L1",
+    "[assert|neutral] ground spans\nlines [ground:a\nb] [conf:0.7]",
+    "[assert|neutral]\n\ncontent on a later line",
+    "[assert|neutral]   ",
+    "[assert|neutral] brackets [inside] content [ground:x] tail [conf:1.2.3]",
+    "prefix text [ASSERT|Positive] upper-case fields [state:CONFIRMED]\r\n",
+    "",
+]
+
+
+class TestVerixTokenizer:
+    """Tests for the streaming VerixTokenizer behind VerixParser.parse()."""
+
+    @pytest.mark.parametrize("text", TOKENIZER_CORPUS)
+    def test_matches_regex_parser(self, text):
+        """parse() should produce exactly what the regex parser produces."""
+        parser = VerixParser()
+        assert parser.parse(text) == parser.parse_regex(text)
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16])
+    def test_streaming_matches_whole_text(self, chunk_size):
+        """Chunked feeding should produce the same claims as one-shot parsing."""
+        parser = VerixParser()
+        for text in TOKENIZER_CORPUS:
+            tokenizer = parser.stream()
+            claims = []
+            for i in range(0, len(text), chunk_size):
+                claims.extend(tokenizer.feed(text[i:i + chunk_size]))
+            claims.extend(tokenizer.close())
+            assert claims == parser.parse_regex(text)
+
+    def test_l1_claims_emitted_before_close(self):
+        """L1 claims should be emitted once the following line starts."""
+        tokenizer = VerixParser().stream()
+        assert tokenizer.feed("[assert|neutral] First [conf:0.9]\n") == []
+        claims = tokenizer.feed("next line")
+        assert [c.content for c in claims] == ["First"]
+        assert tokenizer.close() == []
+
+    def test_l0_claims_held_until_close(self):
+        """L0 claims depend on the absence of L1, so they wait for close()."""
+        tokenizer = VerixParser().stream()
+        assert tokenizer.feed("A.85:First\nE+40:Second\n") == []
+        claims = tokenizer.close()
+        assert [c.content for c in claims] == ["First", "Second"]
+
+    def test_feed_after_close_raises(self):
+        """The tokenizer should reject input after close()."""
+        tokenizer = VerixParser().stream()
+        tokenizer.close()
+        with pytest.raises(ValueError):
+            tokenizer.feed("[assert|neutral] late")
+
+
 class TestVerixValidator:
     """Tests for VerixValidator."""
 